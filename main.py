@@ -19,10 +19,11 @@ if sys.platform == 'win32':
     except Exception:
         pass  # Fail silently on non-Windows or if ctypes fails
 
+import multiprocessing
 import subprocess
 from PySide6.QtWidgets import QApplication
 from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QIcon
+from PySide6.QtGui import QIcon, QPixmapCache
 from ui.main_window import MainWindow
 
 
@@ -95,6 +96,9 @@ def main():
     app.setApplicationName("ClearSight Docs")
     app.setOrganizationName("ClearSight Docs")
     
+    # Shared in-memory budget for rendered page thumbnails and previews (in KB)
+    QPixmapCache.setCacheLimit(131072)
+    
     # Set application icon for taskbar and Alt+Tab
     icon_path = resource_path("app_icon.ico")
     app_icon = None
@@ -120,4 +124,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Needed by worker processes (thumbnail rendering) in PyInstaller builds
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,97 @@
+"""
+Image Operations
+Pixel kernels used on rendered page images.
+Work on NumPy arrays in place of Python loops or QImage calls; compiled with
+Numba when it is installed, with equivalent NumPy versions otherwise.
+"""
+import numpy as np
+
+# Try to import numba for JIT-compiled kernels
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+if HAS_NUMBA:
+    @njit(nogil=True, cache=False)
+    def _is_grayscale_kernel(arr, tolerance, step):
+        height, width = arr.shape[0], arr.shape[1]
+        for y in range(0, height, step):
+            for x in range(0, width, step):
+                r = np.int16(arr[y, x, 0])
+                g = np.int16(arr[y, x, 1])
+                b = np.int16(arr[y, x, 2])
+                if abs(r - g) >= tolerance or abs(g - b) >= tolerance:
+                    return False
+        return True
+    
+    @njit(nogil=True, cache=False)
+    def _to_grayscale_kernel(arr):
+        height, width = arr.shape[0], arr.shape[1]
+        out = np.empty((height, width), dtype=np.uint8)
+        for y in range(height):
+            for x in range(width):
+                out[y, x] = (299 * np.int32(arr[y, x, 0]) + 587 * np.int32(arr[y, x, 1]) + 114 * np.int32(arr[y, x, 2])) // 1000
+        return out
+
+
+def is_grayscale(arr: np.ndarray, tolerance: int = 4, step: int = 4) -> bool:
+    """
+    Check whether an RGB array is effectively gray.
+    
+    Only every step-th pixel in each direction is compared, which is plenty
+    to tell text-only pages from pages with colored content.
+    
+    Args:
+        arr: (height, width, channels) uint8 array
+        tolerance: Largest channel difference still treated as gray
+        step: Sampling stride in pixels
+    """
+    if HAS_NUMBA:
+        return bool(_is_grayscale_kernel(arr, tolerance, step))
+    
+    sample = arr[::step, ::step].astype(np.int16)
+    return bool(
+        np.abs(sample[..., 0] - sample[..., 1]).max() < tolerance
+        and np.abs(sample[..., 1] - sample[..., 2]).max() < tolerance
+    )
+
+
+def to_grayscale(arr: np.ndarray) -> np.ndarray:
+    """
+    Convert an RGB array to a contiguous 8-bit luminance array (ITU-R 601 weights).
+    
+    Args:
+        arr: (height, width, channels) uint8 array
+    
+    Returns:
+        (height, width) uint8 array
+    """
+    if HAS_NUMBA:
+        return _to_grayscale_kernel(arr)
+    
+    weights = np.array([299, 587, 114], dtype=np.int32)
+    return (arr[..., :3] @ weights // 1000).astype(np.uint8)
+
+
+def row_extreme_points(mask: np.ndarray) -> np.ndarray:
+    """
+    Return the first and last set pixel of every row of a mask as (row, column) pairs.
+    
+    These include every vertex of the convex hull of all set pixels, so shape
+    fits that only depend on the hull (e.g. cv2.minAreaRect) give the same
+    result as on np.column_stack(np.where(mask)) from far fewer points.
+    
+    Args:
+        mask: (height, width) boolean array
+    
+    Returns:
+        (n, 2) int array of (row, column) points
+    """
+    rows = np.flatnonzero(mask.any(axis=1))
+    row_masks = mask[rows]
+    first = row_masks.argmax(axis=1)
+    last = mask.shape[1] - 1 - row_masks[:, ::-1].argmax(axis=1)
+    return np.concatenate((np.column_stack((rows, first)), np.column_stack((rows, last))))
@@ -3,7 +3,7 @@ OCR Service for PDF text extraction and searchable PDF creation.
 Handles conversion of scanned/image-based PDFs to text or searchable PDFs.
 
 Uses Tesseract OCR via pytesseract for text recognition.
-Uses pdf2image (with Poppler) for PDF to image conversion.
+Uses PyMuPDF for PDF to image conversion.
 """
 import os
 import re
@@ -12,14 +12,14 @@ import tempfile
 import shutil
 import unicodedata
 from pathlib import Path
-from typing import Optional, Callable, Tuple, List
+from typing import Optional, Callable, Iterator, Tuple, List
 from dataclasses import dataclass
 from enum import Enum
 
 import cv2
+import fitz  # PyMuPDF
 import numpy as np
 import pytesseract
-from pdf2image import convert_from_path
 from PIL import Image
 from pypdf import PdfReader, PdfWriter
 from reportlab.pdfgen import canvas
@@ -27,6 +27,8 @@ from reportlab.lib.pagesizes import letter
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 
+from services.image_ops import row_extreme_points
+
 
 def _configure_poppler_path():
     """
@@ -424,6 +426,26 @@ class OCRService:
         else:
             return self._ocr_to_searchable_pdf(pdf_path, output_path, settings, effective_dpi, progress_callback)
     
+    def _iter_page_images(self, doc: fitz.Document, dpi: int) -> Iterator[Image.Image]:
+        """
+        Yield the pages of a PDF as images, rendered one at a time with PyMuPDF.
+        
+        Pages are rendered straight from the open document, so no Poppler
+        process or temporary image files are involved and only the current
+        page is held in memory.
+        
+        Args:
+            doc: Open PyMuPDF document.
+            dpi: Resolution for rendering.
+            
+        Yields:
+            PIL Image of each page, in page order.
+        """
+        for page in doc:
+            pixmap = page.get_pixmap(dpi=dpi, alpha=False)
+            # samples_mv avoids an intermediate bytes copy of the whole page
+            yield Image.frombytes("RGB", (pixmap.width, pixmap.height), pixmap.samples_mv)
+    
     def _extract_existing_text(
         self,
         pdf_path: str,
@@ -478,21 +500,18 @@ class OCRService:
         progress_callback: Optional[Callable[[int, int, str], None]] = None
     ) -> OCRResult:
         """Perform OCR and save result as plain text."""
-        temp_dir = None
+        doc = None
         try:
-            # Create temporary directory for images
-            temp_dir = tempfile.mkdtemp()
-            
             if progress_callback:
                 progress_callback(0, 0, "Converting PDF to images...")
             
-            # Convert PDF to images
-            images = convert_from_path(pdf_path, dpi=effective_dpi)
-            page_count = len(images)
+            doc = fitz.open(pdf_path)
+            page_count = len(doc)
             all_text = []
             pages_with_text = 0
             
-            for i, image in enumerate(images):
+            # Pages are rendered one at a time as they are processed
+            for i, image in enumerate(self._iter_page_images(doc, effective_dpi)):
                 if progress_callback:
                     progress_callback(i + 1, page_count, f"Processing page {i + 1} of {page_count}...")
                 
@@ -535,9 +554,8 @@ class OCRService:
                 error_message=f"OCR failed: {str(e)}"
             )
         finally:
-            # Cleanup temp directory
-            if temp_dir and os.path.exists(temp_dir):
-                shutil.rmtree(temp_dir)
+            if doc is not None:
+                doc.close()
     
     def _ocr_to_searchable_pdf(
         self,
@@ -549,6 +567,7 @@ class OCRService:
     ) -> OCRResult:
         """Perform OCR and create searchable PDF with text layer."""
         temp_dir = None
+        doc = None
         try:
             # Create temporary directory
             temp_dir = tempfile.mkdtemp()
@@ -556,15 +575,15 @@ class OCRService:
             if progress_callback:
                 progress_callback(0, 0, "Converting PDF to images...")
             
-            # Convert PDF to images
-            images = convert_from_path(pdf_path, dpi=effective_dpi)
-            page_count = len(images)
+            doc = fitz.open(pdf_path)
+            page_count = len(doc)
             pages_with_text = 0
             
             # Create output PDF
             writer = PdfWriter()
             
-            for i, image in enumerate(images):
+            # Pages are rendered one at a time as they are processed
+            for i, image in enumerate(self._iter_page_images(doc, effective_dpi)):
                 if progress_callback:
                     progress_callback(i + 1, page_count, f"Processing page {i + 1} of {page_count}...")
                 
@@ -630,6 +649,8 @@ class OCRService:
                 error_message=f"OCR failed: {str(e)}"
             )
         finally:
+            if doc is not None:
+                doc.close()
             # Cleanup temp directory
             if temp_dir and os.path.exists(temp_dir):
                 shutil.rmtree(temp_dir)
@@ -668,8 +689,9 @@ class OCRService:
                 cv2.THRESH_BINARY, 11, 2
             )
             
-            # Deskew
-            coords = np.column_stack(np.where(thresh > 0))
+            # Deskew; the rotated rectangle only depends on the convex hull of the
+            # foreground, so the end pixels of each row are enough to fit it
+            coords = row_extreme_points(thresh > 0)
             if len(coords) > 0:
                 angle = cv2.minAreaRect(coords)[-1]
                 if angle < -45:
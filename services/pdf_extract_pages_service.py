@@ -4,7 +4,7 @@ Handles extracting specific pages from PDF files.
 """
 from pathlib import Path
 from pypdf import PdfWriter, PdfReader
-from typing import List
+from typing import Callable, List, Optional
 
 
 class PdfExtractPagesService:
@@ -14,7 +14,8 @@ class PdfExtractPagesService:
         self,
         pdf_path: str,
         output_path: str,
-        pages_to_extract: List[int]
+        pages_to_extract: List[int],
+        progress_callback: Optional[Callable[[int, int], None]] = None
     ) -> bool:
         """
         Extract specific pages from a PDF into a new PDF.
@@ -23,6 +24,7 @@ class PdfExtractPagesService:
             pdf_path: Path to the source PDF file
             output_path: Path where the extracted PDF should be saved
             pages_to_extract: List of page numbers to extract (1-indexed)
+            progress_callback: Optional callback for progress updates (pages_added, total_to_add)
             
         Returns:
             True if successful, False otherwise
@@ -45,8 +47,10 @@ class PdfExtractPagesService:
             sorted_pages = sorted(set(pages_to_extract))
             
             # Add specified pages (convert from 1-indexed to 0-indexed)
-            for page_num in sorted_pages:
+            for i, page_num in enumerate(sorted_pages):
                 pdf_writer.add_page(pdf_reader.pages[page_num - 1])
+                if progress_callback:
+                    progress_callback(i + 1, len(sorted_pages))
             
             # Write the output PDF
             with open(output_path, 'wb') as output_file:
@@ -62,7 +66,8 @@ class PdfExtractPagesService:
         self,
         pdf_path: str,
         output_path: str,
-        pages_to_extract: List[int]
+        pages_to_extract: List[int],
+        progress_callback: Optional[Callable[[int, int], None]] = None
     ) -> bool:
         """
         Extract specific pages from a PDF into a new PDF, preserving the specified order.
@@ -71,6 +76,7 @@ class PdfExtractPagesService:
             pdf_path: Path to the source PDF file
             output_path: Path where the extracted PDF should be saved
             pages_to_extract: List of page numbers to extract (1-indexed), in desired order
+            progress_callback: Optional callback for progress updates (pages_added, total_to_add)
             
         Returns:
             True if successful, False otherwise
@@ -90,8 +96,10 @@ class PdfExtractPagesService:
                 raise ValueError("No pages specified to extract.")
             
             # Add pages in the specified order (convert from 1-indexed to 0-indexed)
-            for page_num in pages_to_extract:
+            for i, page_num in enumerate(pages_to_extract):
                 pdf_writer.add_page(pdf_reader.pages[page_num - 1])
+                if progress_callback:
+                    progress_callback(i + 1, len(pages_to_extract))
             
             # Write the output PDF
             with open(output_path, 'wb') as output_file:
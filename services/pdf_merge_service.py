@@ -2,20 +2,92 @@
 PDF merge service.
 Handles merging multiple PDF files into a single document.
 """
-from typing import List
+from typing import Callable, List, Optional, Tuple
 from pypdf import PdfWriter, PdfReader
 
+# Try to import fitz (PyMuPDF) for PDF thumbnails
+try:
+    import fitz
+    HAS_FITZ = True
+except ImportError:
+    HAS_FITZ = False
+
+# Try to import pypdfium2 for faster first-page renders in worker processes
+try:
+    import pypdfium2 as pdfium
+    HAS_PDFIUM = True
+except ImportError:
+    HAS_PDFIUM = False
+
+
+def _render_first_page_pdfium(pdf_path: str, thumbnail_size: int) -> Tuple[bytes, int, int, int, int]:
+    """Render the first page with pdfium, which opens a document faster than MuPDF."""
+    pdf = pdfium.PdfDocument(pdf_path)
+    try:
+        page_count = len(pdf)
+        if page_count == 0:
+            return b"", 0, 0, 0, 0
+        
+        page = pdf[0]
+        scale = thumbnail_size / max(page.get_size())
+        # rev_byteorder gives RGB instead of pdfium's native BGR
+        bitmap = page.render(scale=scale, rev_byteorder=True)
+        return bytes(bitmap.buffer), bitmap.width, bitmap.height, bitmap.stride, page_count
+    finally:
+        pdf.close()
+
+
+def render_first_page(pdf_path: str, thumbnail_size: int) -> Tuple[bytes, int, int, int, int]:
+    """
+    Render the first page of a PDF as raw RGB samples at thumbnail size.
+    
+    Module-level and Qt-free so it can run in a worker process. Uses pdfium
+    when it is installed and falls back to MuPDF if that fails; pdfium is not
+    thread-safe, so this must only be called from a single-threaded process.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        thumbnail_size: Length of the longer side of the rendered image
+        
+    Returns:
+        (samples, width, height, stride, page_count); samples is empty for a PDF without pages
+    """
+    if HAS_PDFIUM:
+        try:
+            return _render_first_page_pdfium(pdf_path, thumbnail_size)
+        except Exception:
+            pass
+    
+    doc = fitz.open(pdf_path)
+    try:
+        page_count = doc.page_count
+        if page_count == 0:
+            return b"", 0, 0, 0, 0
+        
+        page = doc[0]
+        scale = thumbnail_size / max(page.rect.width, page.rect.height)
+        pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale), alpha=False, colorspace=fitz.csRGB)
+        return pix.samples, pix.width, pix.height, pix.stride, page_count
+    finally:
+        doc.close()
+
 
 class PdfMergeService:
     """Service for merging PDF files."""
     
-    def merge_pdfs(self, pdf_paths: List[str], output_path: str) -> bool:
+    def merge_pdfs(
+        self,
+        pdf_paths: List[str],
+        output_path: str,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> bool:
         """
         Merge multiple PDF files into a single PDF.
         
         Args:
             pdf_paths: List of paths to PDF files (in order)
             output_path: Path where the merged PDF should be saved
+            progress_callback: Optional callback for progress updates (files_added, total_files)
             
         Returns:
             True if successful, False otherwise
@@ -25,10 +97,12 @@ class PdfMergeService:
             pdf_writer = PdfWriter()
             
             # Add all pages from each PDF
-            for pdf_path in pdf_paths:
+            for i, pdf_path in enumerate(pdf_paths):
                 pdf_reader = PdfReader(pdf_path)
                 for page in pdf_reader.pages:
                     pdf_writer.add_page(page)
+                if progress_callback:
+                    progress_callback(i + 1, len(pdf_paths))
             
             # Write the merged PDF
             with open(output_path, 'wb') as output_file:
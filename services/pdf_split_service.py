@@ -2,19 +2,33 @@
 PDF split service.
 Handles splitting PDF files by page range or into individual pages.
 """
+import os
 from pathlib import Path
-from pypdf import PdfWriter, PdfReader
+from typing import Callable, Optional
+import fitz  # PyMuPDF
+
+
+def _remove_partial(path: str):
+    """Delete a partially written output file, if one was left behind."""
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
 
 
 class PdfSplitService:
     """Service for splitting PDF files."""
     
+    RANGE_CHUNK_PAGES = 20  # Pages copied per insert_pdf call between progress updates
+    
     def split_by_range(
         self,
         pdf_path: str,
         output_path: str,
         start_page: int,
-        end_page: int
+        end_page: int,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        doc: Optional[fitz.Document] = None
     ) -> bool:
         """
         Extract a range of pages from a PDF.
@@ -24,47 +38,87 @@ class PdfSplitService:
             output_path: Path where the split PDF should be saved
             start_page: First page to extract (1-indexed)
             end_page: Last page to extract (1-indexed, inclusive)
+            progress_callback: Optional callback for progress updates (pages_added, total_pages_to_add)
+            doc: Optional fitz document already opened from pdf_path; it is read, not modified or closed
             
         Returns:
             True if successful, False otherwise
         """
+        source = doc
+        # Saved beside the destination and renamed into place once complete, so a failed
+        # or interrupted split never leaves a truncated PDF at output_path
+        partial_path = output_path + ".part"
         try:
-            pdf_reader = PdfReader(pdf_path)
-            pdf_writer = PdfWriter()
+            if source is None:
+                source = fitz.open(pdf_path)
             
             # Validate page range
-            total_pages = len(pdf_reader.pages)
+            total_pages = source.page_count
             if start_page < 1 or end_page > total_pages or start_page > end_page:
                 raise ValueError(f"Invalid page range. PDF has {total_pages} pages.")
             
-            # Add pages to writer (convert from 1-indexed to 0-indexed)
-            for page_num in range(start_page - 1, end_page):
-                pdf_writer.add_page(pdf_reader.pages[page_num])
+            # Copy the range in chunks so progress is reported while pages are copied; the
+            # output keeps a graft map per source, so resources shared by pages in different
+            # chunks are still copied once (convert from 1-indexed to 0-indexed)
+            total_to_add = end_page - start_page + 1
+            output_doc = fitz.open()
+            try:
+                for first_page in range(start_page - 1, end_page, self.RANGE_CHUNK_PAGES):
+                    last_page = min(first_page + self.RANGE_CHUNK_PAGES, end_page) - 1
+                    output_doc.insert_pdf(source, from_page=first_page, to_page=last_page)
+                    
+                    # The last chunk is reported once the file has been saved
+                    pages_added = last_page - start_page + 2
+                    if progress_callback and pages_added < total_to_add:
+                        progress_callback(pages_added, total_to_add)
+                
+                output_doc.save(partial_path, garbage=3, deflate=True)
+            finally:
+                output_doc.close()
+            os.replace(partial_path, output_path)
             
-            # Write the output PDF
-            with open(output_path, 'wb') as output_file:
-                pdf_writer.write(output_file)
+            if progress_callback:
+                progress_callback(total_to_add, total_to_add)
             
             return True
             
         except Exception as e:
             print(f"Error splitting PDF by range: {e}")
+            _remove_partial(partial_path)
             return False
+        
+        finally:
+            if doc is None and source is not None:
+                source.close()
     
-    def split_into_pages(self, pdf_path: str, output_dir: str) -> bool:
+    def split_into_pages(
+        self,
+        pdf_path: str,
+        output_dir: str,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        doc: Optional[fitz.Document] = None,
+        batch_size: int = 1
+    ) -> bool:
         """
-        Split a PDF into individual pages.
+        Split a PDF into individual pages, or into files of batch_size consecutive pages.
         
         Args:
             pdf_path: Path to the source PDF file
             output_dir: Directory where individual page PDFs should be saved
+            progress_callback: Optional callback for progress updates (pages_written, total_pages)
+            doc: Optional fitz document already opened from pdf_path; it is read, not modified or closed
+            batch_size: Number of pages per output file; 1 writes one file per page
             
         Returns:
             True if successful, False otherwise
         """
+        source = doc
+        partial_path = None
         try:
-            pdf_reader = PdfReader(pdf_path)
-            total_pages = len(pdf_reader.pages)
+            # The source is opened and parsed once; every output page is copied from it
+            if source is None:
+                source = fitz.open(pdf_path)
+            total_pages = source.page_count
             
             # Get the base filename
             base_name = Path(pdf_path).stem
@@ -73,24 +127,43 @@ class PdfSplitService:
             # Create output directory if it doesn't exist
             output_dir_path.mkdir(parents=True, exist_ok=True)
             
-            # Split each page
-            for page_num in range(total_pages):
-                pdf_writer = PdfWriter()
-                pdf_writer.add_page(pdf_reader.pages[page_num])
+            # Split each page, or each batch of pages
+            batch_size = max(1, batch_size)
+            for first_page in range(0, total_pages, batch_size):
+                last_page = min(first_page + batch_size, total_pages) - 1
                 
-                # Create output filename with zero-padded page number
-                output_filename = f"{base_name}_page_{page_num + 1:03d}.pdf"
-                output_path = output_dir_path / output_filename
+                # Create output filename with zero-padded page numbers
+                if batch_size == 1:
+                    output_filename = f"{base_name}_page_{first_page + 1:03d}.pdf"
+                else:
+                    output_filename = f"{base_name}_pages_{first_page + 1:03d}-{last_page + 1:03d}.pdf"
+                output_path = str(output_dir_path / output_filename)
                 
-                # Write the page
-                with open(output_path, 'wb') as output_file:
-                    pdf_writer.write(output_file)
+                # Write the pages to a partial file and rename it into place once complete
+                partial_path = output_path + ".part"
+                page_doc = fitz.open()
+                try:
+                    page_doc.insert_pdf(source, from_page=first_page, to_page=last_page)
+                    page_doc.save(partial_path, garbage=3, deflate=True)
+                finally:
+                    page_doc.close()
+                os.replace(partial_path, output_path)
+                partial_path = None
+                
+                if progress_callback:
+                    progress_callback(last_page + 1, total_pages)
             
             return True
             
         except Exception as e:
             print(f"Error splitting PDF into pages: {e}")
+            if partial_path is not None:
+                _remove_partial(partial_path)
             return False
+        
+        finally:
+            if doc is None and source is not None:
+                source.close()
     
     def get_page_count(self, pdf_path: str) -> int:
         """
@@ -103,8 +176,8 @@ class PdfSplitService:
             Number of pages, or 0 if error
         """
         try:
-            pdf_reader = PdfReader(pdf_path)
-            return len(pdf_reader.pages)
+            with fitz.open(pdf_path) as doc:
+                return doc.page_count
         except Exception as e:
             print(f"Error reading PDF: {e}")
             return 0
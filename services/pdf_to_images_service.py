@@ -2,25 +2,66 @@
 PDF to Images conversion service.
 Handles converting PDF pages to images and packaging them in a ZIP file.
 """
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
+import multiprocessing
 import zipfile
 import tempfile
 import os
 import shutil
 
-from PIL import Image
+# Documents opened by a worker process, reused for every page it renders
+_process_documents = {}
+
+# JPEG quality used by both renderers; 85 keeps text clean in smaller files than 95
+JPEG_QUALITY = 85
+
+
+def _save_page_image(page, dpi: int, image_format: str, output_path: str):
+    """
+    Render one fitz page at the given DPI and write it as PNG or JPEG.
+    
+    MuPDF encodes straight from the pixmap to the file, so no copy of the
+    samples is made; the format follows from the file extension.
+    """
+    pix = page.get_pixmap(dpi=dpi)
+    if image_format.upper() == 'PNG':
+        pix.save(output_path)
+    else:
+        pix.save(output_path, jpg_quality=JPEG_QUALITY)
+
+
+def _render_page_in_process(pdf_path: str, page_num: int, dpi: int, image_format: str, output_path: str) -> int:
+    """
+    Render one page to an image file.
+    
+    Module-level so it can run in a worker process; each process opens the
+    PDF once and keeps it for the rest of its pages.
+    """
+    import fitz  # PyMuPDF
+    
+    doc = _process_documents.get(pdf_path)
+    if doc is None:
+        doc = _process_documents[pdf_path] = fitz.open(pdf_path)
+    _save_page_image(doc[page_num], dpi, image_format, output_path)
+    return page_num
 
 
 class PdfToImagesService:
     """Service for converting PDF pages to images."""
     
+    PROCESS_POOL_MIN_PAGES = 8  # Smaller documents render faster than worker processes start
+    POPPLER_WINDOW_PAGES = 10  # Pages poppler renders per call between progress updates
+    
     def convert_pdf_to_images_zip(
         self,
         pdf_path: str,
         output_zip_path: str,
         image_format: str = "PNG",
-        dpi: int = 150
+        dpi: int = 150,
+        doc=None,
+        progress_callback: Optional[Callable[[int, int], None]] = None
     ) -> bool:
         """
         Convert all pages of a PDF to images and save as a ZIP file.
@@ -30,61 +71,21 @@ class PdfToImagesService:
             output_zip_path: Path where the ZIP file should be saved
             image_format: Output image format (PNG or JPG)
             dpi: Resolution in dots per inch (higher = better quality, larger files)
+            doc: Optional fitz document already opened from pdf_path; reused by the
+                PyMuPDF renderer instead of opening the file again
+            progress_callback: Optional callback for progress updates (pages_done, total_pages)
             
         Returns:
             True if successful, False otherwise
         """
+        # The ZIP is written next to its destination and renamed into place once complete,
+        # so an interrupted conversion never leaves a truncated file at output_zip_path
+        partial_path = output_zip_path + ".part"
         try:
-            print(f"Converting PDF to images: {pdf_path}")
-            print(f"Output ZIP: {output_zip_path}")
-            print(f"Format: {image_format}, DPI: {dpi}")
-            
-            # Import pdf2image here to avoid import errors if not installed
-            try:
-                from pdf2image import convert_from_path
-                from pdf2image.exceptions import PDFInfoNotInstalledError
-            except ImportError:
-                # Fallback to pypdf + PIL method
-                return self._convert_with_pypdf(pdf_path, output_zip_path, image_format)
-            
-            # Try using pdf2image (requires poppler)
-            try:
-                images = convert_from_path(pdf_path, dpi=dpi)
-            except PDFInfoNotInstalledError:
-                print("Poppler not installed, falling back to pypdf method")
-                return self._convert_with_pypdf(pdf_path, output_zip_path, image_format)
-            except Exception as e:
-                print(f"pdf2image failed: {e}, falling back to pypdf method")
-                return self._convert_with_pypdf(pdf_path, output_zip_path, image_format)
-            
-            # Get base filename without extension
-            base_name = Path(pdf_path).stem
-            
-            # Create ZIP file with images
-            with zipfile.ZipFile(output_zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for i, image in enumerate(images, start=1):
-                    # Create filename with zero-padded page number
-                    ext = 'png' if image_format.upper() == 'PNG' else 'jpg'
-                    image_filename = f"{base_name}_page_{i:03d}.{ext}"
-                    
-                    # Save image to a temporary file, then add to ZIP
-                    with tempfile.NamedTemporaryFile(suffix=f'.{ext}', delete=False) as tmp:
-                        if image_format.upper() == 'PNG':
-                            image.save(tmp.name, 'PNG')
-                        else:
-                            image.save(tmp.name, 'JPEG', quality=95)
-                        
-                        # Add to ZIP
-                        zipf.write(tmp.name, image_filename)
-                        
-                        # Clean up temp file
-                        os.unlink(tmp.name)
-                    
-                    print(f"  Added: {image_filename}")
-            
-            print(f"✓ Created ZIP with {len(images)} images")
+            self._write_images_zip(pdf_path, partial_path, image_format, dpi, doc, progress_callback)
+            os.replace(partial_path, output_zip_path)
             return True
-            
+        
         except Exception as e:
             print(f"Error converting PDF to images: {e}")
             import traceback
@@ -92,27 +93,112 @@ class PdfToImagesService:
             
             # Clean up partial ZIP file
             try:
-                if Path(output_zip_path).exists():
-                    Path(output_zip_path).unlink()
+                if Path(partial_path).exists():
+                    Path(partial_path).unlink()
             except Exception:
                 pass
             
             raise
     
+    def _write_images_zip(
+        self,
+        pdf_path: str,
+        output_zip_path: str,
+        image_format: str,
+        dpi: int,
+        doc=None,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> bool:
+        """Render the pages with pdf2image, or PyMuPDF when poppler is unavailable, and write the ZIP."""
+        print(f"Converting PDF to images: {pdf_path}")
+        print(f"Output ZIP: {output_zip_path}")
+        print(f"Format: {image_format}, DPI: {dpi}")
+        
+        # Import pdf2image here to avoid import errors if not installed
+        try:
+            from pdf2image import convert_from_path, pdfinfo_from_path
+            from pdf2image.exceptions import PDFInfoNotInstalledError
+        except ImportError:
+            # Fallback to pypdf + PIL method
+            return self._convert_with_pypdf(pdf_path, output_zip_path, image_format, dpi, doc, progress_callback)
+        
+        # Get base filename without extension
+        base_name = Path(pdf_path).stem
+        ext = 'png' if image_format.upper() == 'PNG' else 'jpg'
+        thread_count = os.cpu_count() or 1
+        # Windows are at least one page per poppler thread so each call still uses every core
+        window_pages = max(self.POPPLER_WINDOW_PAGES, thread_count)
+        
+        # Try using pdf2image (requires poppler); poppler writes the pages straight
+        # to a temp folder instead of every page being held in memory as a PIL image
+        temp_dir = tempfile.mkdtemp()
+        try:
+            try:
+                total_pages = doc.page_count if doc is not None else pdfinfo_from_path(pdf_path)["Pages"]
+                
+                # Create ZIP file with images; PNG and JPEG are already compressed, so store them as-is
+                with zipfile.ZipFile(output_zip_path, 'w', zipfile.ZIP_STORED) as zipf:
+                    # Render a window of pages at a time so progress follows the rendering,
+                    # rather than jumping to 100% once poppler has finished every page
+                    for first_page in range(1, total_pages + 1, window_pages):
+                        last_page = min(first_page + window_pages - 1, total_pages)
+                        image_paths = convert_from_path(
+                            pdf_path,
+                            dpi=dpi,
+                            first_page=first_page,
+                            last_page=last_page,
+                            thread_count=thread_count,
+                            output_folder=temp_dir,
+                            fmt='png' if image_format.upper() == 'PNG' else 'jpeg',
+                            jpegopt={"quality": JPEG_QUALITY},
+                            paths_only=True
+                        )
+                        
+                        for page_num, image_path in enumerate(image_paths, start=first_page):
+                            # Create filename with zero-padded page number
+                            image_filename = f"{base_name}_page_{page_num:03d}.{ext}"
+                            zipf.write(image_path, image_filename)
+                            os.unlink(image_path)
+                            
+                            print(f"  Added: {image_filename}")
+                        
+                        if progress_callback:
+                            progress_callback(last_page, total_pages)
+            except PDFInfoNotInstalledError:
+                print("Poppler not installed, falling back to pypdf method")
+                return self._convert_with_pypdf(pdf_path, output_zip_path, image_format, dpi, doc, progress_callback)
+            except Exception as e:
+                print(f"pdf2image failed: {e}, falling back to pypdf method")
+                return self._convert_with_pypdf(pdf_path, output_zip_path, image_format, dpi, doc, progress_callback)
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        
+        print(f"✓ Created ZIP with {total_pages} images")
+        return True
+    
     def _convert_with_pypdf(
         self,
         pdf_path: str,
         output_zip_path: str,
-        image_format: str = "PNG"
+        image_format: str = "PNG",
+        dpi: int = 150,
+        doc=None,
+        progress_callback: Optional[Callable[[int, int], None]] = None
     ) -> bool:
         """
         Fallback method using PyMuPDF to render PDF pages to images.
+        
+        Documents of PROCESS_POOL_MIN_PAGES pages or more are rendered in
+        parallel worker processes. A document passed in by the caller is left
+        open; one opened here is closed.
         """
         import fitz  # PyMuPDF
         
         print("Using PyMuPDF for PDF rendering...")
         
-        doc = fitz.open(pdf_path)
+        owns_doc = doc is None
+        if owns_doc:
+            doc = fitz.open(pdf_path)
         base_name = Path(pdf_path).stem
         
         # Create a temporary directory for images
@@ -121,32 +207,41 @@ class PdfToImagesService:
         try:
             image_files = []
             
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                
-                # Render page to image (2x zoom for good quality)
-                mat = fitz.Matrix(2, 2)
-                pix = page.get_pixmap(matrix=mat)
-                
-                ext = 'png' if image_format.upper() == 'PNG' else 'jpg'
+            ext = 'png' if image_format.upper() == 'PNG' else 'jpg'
+            page_count = len(doc)
+            for page_num in range(page_count):
                 image_filename = f"{base_name}_page_{page_num + 1:03d}.{ext}"
-                temp_image_path = os.path.join(temp_dir, image_filename)
-                
-                # Save directly to the temp directory
-                if image_format.upper() == 'PNG':
-                    pix.save(temp_image_path)
-                else:
-                    # Convert to PIL for JPEG with quality setting
-                    img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-                    img.save(temp_image_path, 'JPEG', quality=95)
-                
-                image_files.append((temp_image_path, image_filename))
-                print(f"  Rendered: {image_filename}")
+                image_files.append((os.path.join(temp_dir, image_filename), image_filename))
+            
+            if page_count >= self.PROCESS_POOL_MIN_PAGES:
+                # MuPDF holds the GIL while rendering, so pages are spread over processes;
+                # spawned rather than forked because the caller runs Qt threads
+                with ProcessPoolExecutor(
+                    max_workers=os.cpu_count(),
+                    mp_context=multiprocessing.get_context("spawn")
+                ) as pool:
+                    futures = [
+                        pool.submit(_render_page_in_process, pdf_path, page_num, dpi, image_format, temp_path)
+                        for page_num, (temp_path, _) in enumerate(image_files)
+                    ]
+                    for done, future in enumerate(as_completed(futures), start=1):
+                        future.result()
+                        if progress_callback:
+                            progress_callback(done, page_count)
+                print(f"  Rendered {page_count} pages in worker processes")
+            else:
+                for page_num, (temp_path, image_filename) in enumerate(image_files):
+                    _save_page_image(doc[page_num], dpi, image_format, temp_path)
+                    print(f"  Rendered: {image_filename}")
+                    
+                    if progress_callback:
+                        progress_callback(page_num + 1, page_count)
             
-            doc.close()
+            if owns_doc:
+                doc.close()
             
-            # Create ZIP file with all images
-            with zipfile.ZipFile(output_zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            # Create ZIP file with all images, stored without a second compression pass
+            with zipfile.ZipFile(output_zip_path, 'w', zipfile.ZIP_STORED) as zipf:
                 for temp_path, filename in image_files:
                     zipf.write(temp_path, filename)
                     print(f"  Added to ZIP: {filename}")
@@ -2,11 +2,15 @@
 PDF to Word Service for converting PDF documents to Word (.docx) format.
 Integrates OCR capabilities for scanned/image-based PDFs.
 """
+import io
 import os
 import tempfile
 import shutil
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Callable, List, Tuple
+from typing import Optional, Callable, Iterator, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -19,6 +23,90 @@ from docx.enum.style import WD_STYLE_TYPE
 
 from services.ocr_service import OCRService, AccuracyMode
 
+# Try to import tesserocr for an in-process Tesseract API
+try:
+    import tesserocr
+    HAS_TESSEROCR = True
+except ImportError:
+    HAS_TESSEROCR = False
+
+# Column names of Tesseract's TSV output, as used by pytesseract's Output.DICT
+_TSV_COLUMNS = (
+    "level", "page_num", "block_num", "par_num", "line_num", "word_num",
+    "left", "top", "width", "height", "conf", "text"
+)
+
+
+def _ocr_concurrency() -> int:
+    """Number of pages to OCR at once; the OCR_CONCURRENCY environment variable overrides the CPU count."""
+    try:
+        return max(1, int(os.environ["OCR_CONCURRENCY"]))
+    except (KeyError, ValueError):
+        return os.cpu_count() or 1
+
+
+def _tsv_to_dict(tsv: str) -> dict:
+    """Convert Tesseract TSV rows (without header) to pytesseract's Output.DICT layout."""
+    data = {column: [] for column in _TSV_COLUMNS}
+    for row in tsv.splitlines():
+        values = row.split("\t", len(_TSV_COLUMNS) - 1)
+        if len(values) < len(_TSV_COLUMNS) - 1:
+            continue
+        values += [""] * (len(_TSV_COLUMNS) - len(values))
+        for column, value in zip(_TSV_COLUMNS[:10], values):
+            data[column].append(int(value))
+        data["conf"].append(float(values[10]))
+        data["text"].append(values[11])
+    return data
+
+
+class _TesseractApiPool:
+    """
+    tesserocr APIs for the worker threads of one conversion.
+    
+    Each thread initializes its own API, loading the language data once, and
+    reuses it for every later page instead of pytesseract starting a tesseract
+    process per page. Recognition releases the GIL, so threads still OCR pages
+    in parallel.
+    """
+    
+    def __init__(self, language: str, accuracy_mode: AccuracyMode):
+        self.language = language
+        # Same engines as OCRService._get_tesseract_config
+        if accuracy_mode == AccuracyMode.FAST:
+            self.oem = tesserocr.OEM.TESSERACT_ONLY
+        else:
+            self.oem = tesserocr.OEM.LSTM_ONLY
+        self._local = threading.local()
+        self._apis = []
+        self._lock = threading.Lock()
+        self._failed = False
+    
+    def get(self) -> Optional["tesserocr.PyTessBaseAPI"]:
+        """Return this thread's API, or None if tesserocr cannot be initialized."""
+        if self._failed:
+            return None
+        
+        api = getattr(self._local, "api", None)
+        if api is None:
+            try:
+                api = tesserocr.PyTessBaseAPI(lang=self.language, oem=self.oem, psm=tesserocr.PSM.AUTO)
+            except RuntimeError:
+                # e.g. missing language data; callers fall back to pytesseract
+                self._failed = True
+                return None
+            self._local.api = api
+            with self._lock:
+                self._apis.append(api)
+        return api
+    
+    def close(self):
+        """Release all APIs created by this pool."""
+        with self._lock:
+            for api in self._apis:
+                api.End()
+            self._apis.clear()
+
 
 class ConversionMode(Enum):
     """Conversion mode options."""
@@ -33,7 +121,7 @@ class PDFToWordSettings:
     """Settings for PDF to Word conversion."""
     conversion_mode: ConversionMode = ConversionMode.AUTO
     language: str = "eng"
-    dpi: int = 300
+    dpi: int = 200
     accuracy_mode: AccuracyMode = AccuracyMode.BALANCED
     include_images: bool = True  # Include images from PDF
     preserve_formatting: bool = True  # Try to preserve bold, italic, etc.
@@ -61,14 +149,69 @@ class PDFToWordService:
     - Basic formatting preservation
     """
     
+    # In AUTO mode, pages with fewer text-layer characters than this are OCRed
+    MIN_TEXT_CHARS = 50
+    
+    # JPEG quality of the page images embedded by the preserve-layout mode
+    PAGE_IMAGE_JPEG_QUALITY = 75
+    
     def __init__(self):
         """Initialize the PDF to Word service."""
         self.ocr_service = OCRService()
     
     def is_tesseract_available(self) -> bool:
-        """Check if Tesseract OCR is available."""
+        """Check if Tesseract OCR is available, through tesserocr or the tesseract executable."""
+        if HAS_TESSEROCR and tesserocr.get_languages()[1]:
+            return True
         return self.ocr_service.is_tesseract_available()
     
+    def _ocr_image_data(
+        self,
+        image: Image.Image,
+        settings: PDFToWordSettings,
+        apis: Optional[_TesseractApiPool]
+    ) -> dict:
+        """OCR a page image and return word boxes in pytesseract's Output.DICT layout."""
+        # Preprocess image for better OCR
+        processed_image = self.ocr_service._preprocess_image(image, settings.accuracy_mode)
+        
+        api = apis.get() if apis is not None else None
+        if api is not None:
+            api.SetImage(processed_image)
+            return _tsv_to_dict(api.GetTSVText(0))
+        
+        import pytesseract
+        
+        # Get OCR text with formatting hints
+        return pytesseract.image_to_data(
+            processed_image,
+            lang=settings.language,
+            config=self.ocr_service._get_tesseract_config(settings.accuracy_mode),
+            output_type=pytesseract.Output.DICT
+        )
+    
+    def _ocr_image_text(
+        self,
+        image: Image.Image,
+        settings: PDFToWordSettings,
+        apis: Optional[_TesseractApiPool]
+    ) -> str:
+        """OCR a page image and return its text."""
+        processed_image = self.ocr_service._preprocess_image(image, settings.accuracy_mode)
+        
+        api = apis.get() if apis is not None else None
+        if api is not None:
+            api.SetImage(processed_image)
+            return api.GetUTF8Text()
+        
+        import pytesseract
+        
+        return pytesseract.image_to_string(
+            processed_image,
+            lang=settings.language,
+            config=self.ocr_service._get_tesseract_config(settings.accuracy_mode)
+        )
+    
     def _pdf_page_to_image(self, page: fitz.Page, dpi: int = 300) -> Image.Image:
         """
         Convert a PDF page to a PIL Image using PyMuPDF.
@@ -88,17 +231,77 @@ class PDFToWordService:
         # Render page to pixmap
         pixmap = page.get_pixmap(matrix=matrix, alpha=False)
         
-        # Convert to PIL Image
-        img = Image.frombytes("RGB", [pixmap.width, pixmap.height], pixmap.samples)
+        # Convert to PIL Image, copying straight from the pixmap's buffer; samples
+        # would first make a full-size bytes copy of the page just to discard it
+        img = Image.frombytes("RGB", [pixmap.width, pixmap.height], pixmap.samples_mv)
         
         return img
     
-    def pdf_has_text(self, pdf_path: str) -> Tuple[bool, int]:
+    def _iter_page_images(
+        self,
+        doc: fitz.Document,
+        dpi: int,
+        ocr_page: Optional[Callable[[Image.Image], object]] = None,
+        page_numbers: Optional[List[int]] = None
+    ) -> Iterator[Tuple[int, Image.Image, object]]:
+        """
+        Render the pages of a document, optionally running OCR on each.
+        
+        Pages are rendered one at a time on the calling thread, since a PyMuPDF
+        document must not be shared between threads. When ocr_page is given it
+        runs on a thread pool: pytesseract starts a separate tesseract process
+        per call, so several pages are recognized in parallel. At most two pages
+        per worker are in flight, which bounds memory at high DPI.
+        
+        Args:
+            doc: Open PyMuPDF document.
+            dpi: Resolution for rendering.
+            ocr_page: Optional function run on each rendered page image.
+            page_numbers: Ascending 0-based pages to render; all pages if None.
+            
+        Yields:
+            (page_index, page_image, ocr_output) in page order; ocr_output is
+            None when ocr_page is not given.
+        """
+        if page_numbers is None:
+            page_numbers = range(len(doc))
+        
+        if ocr_page is None:
+            for i in page_numbers:
+                yield i, self._pdf_page_to_image(doc[i], dpi), None
+            return
+        
+        workers = _ocr_concurrency()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending = deque()
+            try:
+                for i in page_numbers:
+                    image = self._pdf_page_to_image(doc[i], dpi)
+                    pending.append((i, image, pool.submit(ocr_page, image)))
+                    if len(pending) >= workers * 2:
+                        page_index, page_image, future = pending.popleft()
+                        yield page_index, page_image, future.result()
+                
+                while pending:
+                    page_index, page_image, future = pending.popleft()
+                    yield page_index, page_image, future.result()
+            finally:
+                # When the caller stops early, skip the pages that have not started;
+                # leaving the with block still waits for the ones already running
+                for _, _, future in pending:
+                    future.cancel()
+    
+    @staticmethod
+    def pdf_has_text(pdf_path: str, max_pages: int = 3) -> Tuple[bool, int]:
         """
         Check if a PDF contains extractable text.
         
+        Only the first max_pages pages are checked, so the cost does not grow
+        with the length of the document.
+        
         Args:
             pdf_path: Path to the PDF file.
+            max_pages: Number of leading pages to check for text.
             
         Returns:
             Tuple of (has_text, page_count)
@@ -108,7 +311,7 @@ class PDFToWordService:
             page_count = len(doc)
             
             # Check first few pages for text
-            pages_to_check = min(3, page_count)
+            pages_to_check = min(max_pages, page_count)
             for i in range(pages_to_check):
                 page = doc[i]
                 text = page.get_text("text")
@@ -187,8 +390,16 @@ class PDFToWordService:
         use_ocr: bool,
         progress_callback: Optional[Callable[[int, int, str], None]] = None
     ) -> ConversionResult:
-        """Convert PDF to Word with text extraction (with or without OCR)."""
+        """
+        Convert PDF to Word with text extraction (with or without OCR).
+        
+        In AUTO mode the decision is made per page: pages whose text layer has
+        at least MIN_TEXT_CHARS characters are extracted directly and only the
+        rest are OCRed, so a scanned cover does not force OCR on a digital body.
+        """
         temp_dir = None
+        apis = None
+        ocr_results = None
         try:
             doc = fitz.open(pdf_path)
             page_count = len(doc)
@@ -201,55 +412,54 @@ class PDFToWordService:
             
             pages_converted = 0
             
-            if use_ocr:
+            # Choose the pages to OCR
+            if settings.conversion_mode == ConversionMode.AUTO and self.is_tesseract_available():
+                ocr_page_numbers = [
+                    i for i in range(page_count)
+                    if len(doc[i].get_text("text").strip()) < self.MIN_TEXT_CHARS
+                ]
+            elif use_ocr:
+                ocr_page_numbers = list(range(page_count))
+            else:
+                ocr_page_numbers = []
+            
+            if ocr_page_numbers:
                 # Use OCR for text extraction (using PyMuPDF for page rendering)
-                import pytesseract
-                
                 temp_dir = tempfile.mkdtemp()
                 
                 if progress_callback:
                     progress_callback(0, page_count, "Converting PDF pages to images...")
                 
-                for i in range(page_count):
+                if HAS_TESSEROCR:
+                    apis = _TesseractApiPool(settings.language, settings.accuracy_mode)
+                
+                def ocr_page(image: Image.Image) -> dict:
+                    return self._ocr_image_data(image, settings, apis)
+                
+                # Pages are OCRed concurrently and come back in page order
+                ocr_results = self._iter_page_images(doc, settings.dpi, ocr_page, ocr_page_numbers)
+            
+            ocr_page_set = set(ocr_page_numbers)
+            for i in range(page_count):
+                page = doc[i]
+                
+                if i in ocr_page_set:
                     if progress_callback:
                         progress_callback(i + 1, page_count, f"OCR processing page {i + 1}...")
                     
-                    # Convert page to image using PyMuPDF
-                    image = self._pdf_page_to_image(doc[i], settings.dpi)
-                    
-                    # Preprocess image for better OCR
-                    processed_image = self.ocr_service._preprocess_image(
-                        image, settings.accuracy_mode
-                    )
-                    
-                    # Get OCR text with formatting hints
-                    ocr_data = pytesseract.image_to_data(
-                        processed_image,
-                        lang=settings.language,
-                        config=self.ocr_service._get_tesseract_config(settings.accuracy_mode),
-                        output_type=pytesseract.Output.DICT
-                    )
+                    _, _, ocr_data = next(ocr_results)
                     
                     # Process OCR data into paragraphs
                     self._add_ocr_text_to_doc(word_doc, ocr_data, settings)
                     
-                    # Add page break except for last page
-                    if i < page_count - 1:
-                        word_doc.add_page_break()
-                    
-                    pages_converted += 1
-                    
                     # Also extract images if requested
                     if settings.include_images:
-                        self._extract_images_from_page(doc[i], word_doc, temp_dir)
-            else:
-                # Extract text directly from PDF
-                for i in range(page_count):
+                        self._extract_images_from_page(page, word_doc, temp_dir)
+                else:
+                    # Extract text directly from PDF
                     if progress_callback:
                         progress_callback(i + 1, page_count, f"Extracting text from page {i + 1}...")
                     
-                    page = doc[i]
-                    
                     # Extract text blocks with formatting
                     blocks = page.get_text("dict", flags=fitz.TEXT_PRESERVE_WHITESPACE)["blocks"]
                     
@@ -260,12 +470,12 @@ class PDFToWordService:
                             if temp_dir is None:
                                 temp_dir = tempfile.mkdtemp()
                             self._add_image_block_to_doc(word_doc, block, temp_dir)
-                    
-                    # Add page break except for last page
-                    if i < page_count - 1:
-                        word_doc.add_page_break()
-                    
-                    pages_converted += 1
+                
+                # Add page break except for last page
+                if i < page_count - 1:
+                    word_doc.add_page_break()
+                
+                pages_converted += 1
             
             doc.close()
             
@@ -277,7 +487,7 @@ class PDFToWordService:
                 output_path=output_path,
                 total_pages=page_count,
                 pages_converted=pages_converted,
-                used_ocr=use_ocr
+                used_ocr=bool(ocr_page_numbers)
             )
             
         except Exception as e:
@@ -286,6 +496,12 @@ class PDFToWordService:
                 error_message=f"Conversion failed: {str(e)}"
             )
         finally:
+            # Stop the OCR generator first: closing it shuts down its thread pool and
+            # waits for running pages, so no thread still uses a tesserocr handle
+            if ocr_results is not None:
+                ocr_results.close()
+            if apis is not None:
+                apis.close()
             if temp_dir and os.path.exists(temp_dir):
                 shutil.rmtree(temp_dir)
     
@@ -301,7 +517,8 @@ class PDFToWordService:
         Convert PDF to Word preserving layout by rendering pages as images
         with text overlay.
         """
-        temp_dir = None
+        apis = None
+        ocr_results = None
         try:
             doc = fitz.open(pdf_path)
             page_count = len(doc)
@@ -316,26 +533,36 @@ class PDFToWordService:
                 section.left_margin = Inches(0.5)
                 section.right_margin = Inches(0.5)
             
-            temp_dir = tempfile.mkdtemp()
-            
             if progress_callback:
                 progress_callback(0, page_count, "Rendering PDF pages...")
             
             pages_converted = 0
             
-            for i in range(page_count):
+            ocr_page = None
+            if use_ocr:
+                if HAS_TESSEROCR:
+                    apis = _TesseractApiPool(settings.language, settings.accuracy_mode)
+                
+                def ocr_page(image: Image.Image) -> str:
+                    return self._ocr_image_text(image, settings, apis)
+            
+            # Pages are rendered with PyMuPDF; with OCR they are recognized concurrently
+            ocr_results = self._iter_page_images(doc, settings.dpi, ocr_page)
+            for i, image, text in ocr_results:
                 if progress_callback:
                     status = f"Processing page {i + 1}..."
                     if use_ocr:
                         status = f"OCR processing page {i + 1}..."
                     progress_callback(i + 1, page_count, status)
                 
-                # Convert page to image using PyMuPDF
-                image = self._pdf_page_to_image(doc[i], settings.dpi)
-                
-                # Save page image
-                img_path = os.path.join(temp_dir, f"page_{i + 1}.png")
-                image.save(img_path, "PNG")
+                # Encode page image in memory; rendered pages have no alpha, so
+                # JPEG keeps the document far smaller than PNG would
+                image_stream = io.BytesIO()
+                if image.mode in ("RGBA", "LA", "P"):
+                    image.save(image_stream, "PNG")
+                else:
+                    image.save(image_stream, "JPEG", quality=self.PAGE_IMAGE_JPEG_QUALITY, optimize=True)
+                image_stream.seek(0)
                 
                 # Add image to Word document
                 # Calculate size to fit page
@@ -343,29 +570,16 @@ class PDFToWordService:
                              word_doc.sections[0].left_margin - \
                              word_doc.sections[0].right_margin
                 
-                word_doc.add_picture(img_path, width=page_width)
+                word_doc.add_picture(image_stream, width=page_width)
                 
                 # If OCR is needed, add text as invisible/small overlay
                 # (for searchability)
-                if use_ocr:
-                    import pytesseract
-                    
-                    processed_image = self.ocr_service._preprocess_image(
-                        image, settings.accuracy_mode
-                    )
-                    
-                    text = pytesseract.image_to_string(
-                        processed_image,
-                        lang=settings.language,
-                        config=self.ocr_service._get_tesseract_config(settings.accuracy_mode)
-                    )
-                    
-                    if text and text.strip():
-                        # Add hidden text paragraph for searchability
-                        para = word_doc.add_paragraph()
-                        run = para.add_run(text.strip())
-                        run.font.size = Pt(1)
-                        run.font.color.rgb = RGBColor(255, 255, 255)  # White (invisible)
+                if text and text.strip():
+                    # Add hidden text paragraph for searchability
+                    para = word_doc.add_paragraph()
+                    run = para.add_run(text.strip())
+                    run.font.size = Pt(1)
+                    run.font.color.rgb = RGBColor(255, 255, 255)  # White (invisible)
                 
                 # Add page break except for last page
                 if i < page_count - 1:
@@ -392,8 +606,11 @@ class PDFToWordService:
                 error_message=f"Layout conversion failed: {str(e)}"
             )
         finally:
-            if temp_dir and os.path.exists(temp_dir):
-                shutil.rmtree(temp_dir)
+            # As in _convert_text_based, no OCR thread may outlive the handles
+            if ocr_results is not None:
+                ocr_results.close()
+            if apis is not None:
+                apis.close()
     
     def _setup_styles(self, word_doc: Document):
         """Set up document styles."""
@@ -139,6 +139,14 @@ class MainWindow(QMainWindow):
             # Delay the check slightly to let the UI fully load
             QTimer.singleShot(2000, self._check_for_updates_background)
     
+    def closeEvent(self, event):
+        """Give pages holding open documents or worker processes a chance to release them on exit."""
+        self.pdf_extract_pages_page.close()
+        self.pdf_merge_page.close()
+        self.pdf_split_page.close()
+        self.pdf_to_images_page.close()
+        super().closeEvent(event)
+    
     def _create_menu_bar(self):
         """Create the application menu bar."""
         menubar = self.menuBar()
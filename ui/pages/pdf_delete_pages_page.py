@@ -9,8 +9,11 @@ from PySide6.QtWidgets import (
     QFrame, QListWidget, QListWidgetItem, QAbstractItemView,
     QListView, QSplitter, QScrollArea, QApplication
 )
-from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QPixmap, QIcon, QImage, QFont
+from PySide6.QtCore import Qt, QSize, QUrl
+from PySide6.QtGui import QPixmap, QIcon, QImage, QFont, QDesktopServices
+
+import cv2
+import numpy as np
 
 from services.pdf_delete_pages_service import PdfDeletePagesService
 
@@ -27,12 +30,13 @@ class PdfDeletePagesPage(QWidget):
     
     THUMBNAIL_SIZE = 150  # Size of page thumbnails
     PREVIEW_WIDTH = 550   # Width of preview panel
+    PREVIEW_JPEG_QUALITY = 85  # JPEG quality for in-memory page previews
     
     def __init__(self):
         super().__init__()
         self.selected_pdf = None
         self.total_pages = 0
-        self.page_thumbnails = []  # Store page pixmaps for preview
+        self.page_thumbnails = []  # Store JPEG-encoded page previews
         self.current_preview_page = -1  # Currently previewed page
         self.zoom_level = 1.0  # Zoom level for preview
         self._is_loading = False  # Flag to track if PDF is being loaded
@@ -208,6 +212,8 @@ class PdfDeletePagesPage(QWidget):
         self.pages_list.setWrapping(True)
         self.pages_list.setWordWrap(True)
         self.pages_list.setUniformItemSizes(True)
+        self.pages_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.pages_list.setBatchSize(100)
         self.pages_list.setMinimumHeight(300)
         self.pages_list.setStyleSheet("""
             QListWidget {
@@ -440,46 +446,53 @@ class PdfDeletePagesPage(QWidget):
             
             doc = fitz.open(file_path)
             self.total_pages = doc.page_count
+            self.page_thumbnails = [None] * self.total_pages
             self.progress_bar.setMaximum(self.total_pages)
             
-            for page_num in range(self.total_pages):
-                page = doc[page_num]
-                
-                # Create thumbnail
-                mat = fitz.Matrix(0.3, 0.3)  # Scale for thumbnail
-                pix = page.get_pixmap(matrix=mat)
-                img = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format.Format_RGB888)
-                thumbnail_pixmap = QPixmap.fromImage(img)
-                
-                # Scale to consistent thumbnail size
-                scaled_thumb = thumbnail_pixmap.scaled(
-                    self.THUMBNAIL_SIZE,
-                    self.THUMBNAIL_SIZE,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                
-                # Create larger preview
-                mat_preview = fitz.Matrix(1.0, 1.0)  # Larger for preview
-                pix_preview = page.get_pixmap(matrix=mat_preview)
-                img_preview = QImage(pix_preview.samples, pix_preview.width, pix_preview.height, pix_preview.stride, QImage.Format.Format_RGB888)
-                preview_pixmap = QPixmap.fromImage(img_preview)
-                self.page_thumbnails.append(preview_pixmap)
-                
-                # Add to list
-                item = QListWidgetItem(QIcon(scaled_thumb), f"Page {page_num + 1}")
-                item.setData(Qt.ItemDataRole.UserRole, page_num)
-                item.setSizeHint(QSize(self.THUMBNAIL_SIZE + 20, self.THUMBNAIL_SIZE + 40))
-                # Make label bold for better visibility
-                font = item.font()
-                font.setBold(True)
-                item.setFont(font)
-                self.pages_list.addItem(item)
-                
-                self.progress_bar.setValue(page_num + 1)
-                
-                # Process events to keep UI responsive
-                QApplication.processEvents()
+            # Suspend list repaints while items are inserted
+            self.pages_list.setUpdatesEnabled(False)
+            self.pages_list.setSortingEnabled(False)
+            try:
+                for page_num in range(self.total_pages):
+                    page = doc[page_num]
+                    
+                    # Create thumbnail
+                    mat = fitz.Matrix(0.3, 0.3)  # Scale for thumbnail
+                    pix = page.get_pixmap(matrix=mat)
+                    img = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format.Format_RGB888)
+                    # Convert once to Qt's native 32-bpp format so scaling and painting skip the repack
+                    img = img.convertToFormat(QImage.Format.Format_RGB32)
+                    
+                    # Scale to consistent thumbnail size
+                    scaled_thumb = QPixmap.fromImage(img.scaled(
+                        self.THUMBNAIL_SIZE,
+                        self.THUMBNAIL_SIZE,
+                        Qt.AspectRatioMode.KeepAspectRatio,
+                        Qt.TransformationMode.SmoothTransformation
+                    ))
+                    
+                    # Create larger preview
+                    mat_preview = fitz.Matrix(1.0, 1.0)  # Larger for preview
+                    pix_preview = page.get_pixmap(matrix=mat_preview)
+                    self.page_thumbnails[page_num] = self._encode_preview(pix_preview)
+                    
+                    # Add to list
+                    item = QListWidgetItem(QIcon(scaled_thumb), f"Page {page_num + 1}")
+                    item.setData(Qt.ItemDataRole.UserRole, page_num)
+                    item.setSizeHint(QSize(self.THUMBNAIL_SIZE + 20, self.THUMBNAIL_SIZE + 40))
+                    # Make label bold for better visibility
+                    font = item.font()
+                    font.setBold(True)
+                    item.setFont(font)
+                    self.pages_list.addItem(item)
+                    
+                    self.progress_bar.setValue(page_num + 1)
+                    
+                    # Process events to keep UI responsive
+                    QApplication.processEvents()
+                    
+            finally:
+                self.pages_list.setUpdatesEnabled(True)
                 
             doc.close()
             
@@ -496,6 +509,19 @@ class PdfDeletePagesPage(QWidget):
         finally:
             self._is_loading = False
     
+    def _encode_preview(self, pix) -> bytes:
+        """Encode a rendered page as JPEG bytes to keep previews compact in memory."""
+        arr = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.stride)
+        arr = arr[:, :pix.width * 3].reshape(pix.height, pix.width, 3)
+        ok, buf = cv2.imencode(
+            '.jpg',
+            cv2.cvtColor(arr, cv2.COLOR_RGB2BGR),
+            [cv2.IMWRITE_JPEG_QUALITY, self.PREVIEW_JPEG_QUALITY]
+        )
+        if not ok:
+            raise ValueError("Could not encode page preview")
+        return buf.tobytes()
+    
     def _on_page_clicked(self, item):
         """Handle page click for preview."""
         page_num = item.data(Qt.ItemDataRole.UserRole)
@@ -512,7 +538,12 @@ class PdfDeletePagesPage(QWidget):
         if self.current_preview_page < 0 or self.current_preview_page >= len(self.page_thumbnails):
             return
         
-        preview = self.page_thumbnails[self.current_preview_page]
+        preview_data = self.page_thumbnails[self.current_preview_page]
+        if preview_data is None:
+            return
+        
+        preview = QPixmap()
+        preview.loadFromData(preview_data, "JPG")
         # Apply zoom to base size
         base_width, base_height = 520, 720
         scaled_width = int(base_width * self.zoom_level)
@@ -642,8 +673,7 @@ class PdfDeletePagesPage(QWidget):
             )
             
             if reply == QMessageBox.StandardButton.Yes:
-                import os
-                os.startfile(output_file)
+                QDesktopServices.openUrl(QUrl.fromLocalFile(output_file))
                 
         except Exception as e:
             self.status_label.setText(f"❌ Error: {str(e)}")
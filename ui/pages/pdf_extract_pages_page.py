@@ -2,17 +2,26 @@
 PDF Extract Pages page with visual thumbnail selection.
 Allows users to visually select and extract pages from a PDF document.
 """
+import heapq
+import threading
 from pathlib import Path
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
     QGroupBox, QFileDialog, QProgressBar, QMessageBox,
     QFrame, QListWidget, QListWidgetItem, QAbstractItemView,
-    QListView, QSplitter, QScrollArea, QCheckBox, QApplication
+    QListView, QSplitter, QScrollArea, QCheckBox
 )
-from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QPixmap, QIcon, QImage, QFont
+from PySide6.QtCore import (
+    Qt, QSize, QObject, QRunnable, QThread, QThreadPool, QTimer, QEvent, Signal,
+    QItemSelection, QItemSelectionModel, QUrl
+)
+from PySide6.QtGui import QPixmap, QPixmapCache, QIcon, QImage, QFont, QColor, QDesktopServices
+
+import numpy as np
 
 from services.pdf_extract_pages_service import PdfExtractPagesService
+from services.image_ops import is_grayscale, to_grayscale
+from utils.thumbnail_cache import ThumbnailDiskCache
 
 # Try to import fitz (PyMuPDF) for PDF thumbnails
 try:
@@ -22,20 +31,239 @@ except ImportError:
     HAS_FITZ = False
 
 
+def _fitz_pixmap_to_ndarray(pix) -> np.ndarray:
+    """
+    View a fitz Pixmap's samples as a (height, width, channels) array.
+    
+    samples_mv is a view of the pixmap buffer (samples would return a new
+    bytes copy on every access), so the array shares memory with the pixmap
+    and is writable in place. The pixmap must be kept alive while the array
+    or anything wrapping it without a copy is in use.
+    """
+    return np.frombuffer(pix.samples_mv, dtype=np.uint8).reshape(pix.height, pix.width, pix.n)
+
+
+def _ndarray_to_qimage(arr: np.ndarray) -> QImage:
+    """
+    Wrap an RGB or grayscale pixel array in a QImage without copying.
+    
+    The array must be kept alive for as long as the image is used.
+    """
+    height, width = arr.shape[:2]
+    channels = arr.shape[2] if arr.ndim == 3 else 1
+    image_format = QImage.Format.Format_Grayscale8 if channels == 1 else QImage.Format.Format_RGB888
+    return QImage(arr.data, width, height, arr.strides[0], image_format)
+
+
+class PageRenderSignals(QObject):
+    """Signals used by page render workers to report back to the UI thread."""
+    
+    pageReady = Signal(int, int, QImage)  # generation, page_num, thumbnail
+    failed = Signal(int, str)  # generation, error message
+
+
+class PageRenderQueue:
+    """
+    Thread-safe priority queue of page renders shared by the render workers.
+    
+    Each schedule() call replaces the pending work, so pages that scrolled
+    out of view are dropped instead of rendered.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._heap = []  # (priority, page_num)
+        self._claimed = set()  # Pages already taken by a worker
+        self._workers = 0  # Workers currently draining the queue
+        self._closed = False
+    
+    def schedule(self, entries: list, max_workers: int) -> int:
+        """
+        Replace pending work with (priority, page_num) entries.
+        
+        Returns the number of additional workers the caller should start.
+        """
+        with self._lock:
+            if self._closed:
+                return 0
+            self._heap = [entry for entry in entries if entry[1] not in self._claimed]
+            heapq.heapify(self._heap)
+            new_workers = max(0, min(len(self._heap), max_workers) - self._workers)
+            self._workers += new_workers
+            return new_workers
+    
+    def pop(self):
+        """Claim the highest-priority page, or return None when the worker should exit."""
+        with self._lock:
+            while self._heap and not self._closed:
+                _, page_num = heapq.heappop(self._heap)
+                if page_num not in self._claimed:
+                    self._claimed.add(page_num)
+                    return page_num
+            self._workers -= 1
+            return None
+    
+    def claim(self, page_num: int) -> bool:
+        """Mark a page as handled without rendering it; False if it was already taken."""
+        with self._lock:
+            if page_num in self._claimed:
+                return False
+            self._claimed.add(page_num)
+            return True
+    
+    def close(self):
+        """Drop all pending work; workers exit after their current page."""
+        with self._lock:
+            self._closed = True
+            self._heap = []
+
+
+class PageRenderWorker(QRunnable):
+    """Worker that renders page thumbnails taken from a PageRenderQueue."""
+    
+    def __init__(
+        self,
+        file_path: str,
+        queue: PageRenderQueue,
+        thumbnail_size: int,
+        generation: int,
+        signals: PageRenderSignals,
+        disk_cache: ThumbnailDiskCache,
+        cache_key: str
+    ):
+        super().__init__()
+        self.file_path = file_path
+        self.queue = queue
+        self.thumbnail_size = thumbnail_size
+        self.generation = generation
+        self.signals = signals
+        self.disk_cache = disk_cache
+        self.cache_key = cache_key  # None disables the disk cache
+    
+    def run(self):
+        """Render queued pages in a background thread until the queue is empty."""
+        doc = None
+        try:
+            page_num = self.queue.pop()
+            while page_num is not None:
+                cached = None
+                if self.cache_key is not None:
+                    cached = self.disk_cache.load(self.cache_key, page_num)
+                
+                if cached is not None:
+                    # Entries written at another thumbnail size are fitted cheaply; the tile is small
+                    if max(cached.width(), cached.height()) != self.thumbnail_size:
+                        cached = cached.scaled(
+                            self.thumbnail_size,
+                            self.thumbnail_size,
+                            Qt.AspectRatioMode.KeepAspectRatio,
+                            Qt.TransformationMode.FastTransformation
+                        )
+                    self.signals.pageReady.emit(self.generation, page_num, cached)
+                else:
+                    # Each worker opens its own document; fitz documents are not shared across threads
+                    if doc is None:
+                        doc = fitz.open(self.file_path)
+                    page = doc[page_num]
+                    # Rasterize straight to thumbnail size so no rescale is needed
+                    scale = self.thumbnail_size / max(page.rect.width, page.rect.height)
+                    pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale))
+                    # QImage is safe to build off the GUI thread; copy() detaches it from the fitz buffer
+                    arr = _fitz_pixmap_to_ndarray(pix)
+                    # Text-only pages are kept as 8-bit grayscale, a third of the RGB size
+                    if is_grayscale(arr):
+                        arr = to_grayscale(arr)
+                    img = _ndarray_to_qimage(arr).copy()
+                    # Release the fitz pixmap now so each thread holds at most one render buffer
+                    del arr, pix
+                    if self.cache_key is not None:
+                        self.disk_cache.save(self.cache_key, page_num, img)
+                    self.signals.pageReady.emit(self.generation, page_num, img)
+                page_num = self.queue.pop()
+        except Exception as e:
+            self.queue.close()
+            self.signals.failed.emit(self.generation, str(e))
+        finally:
+            if doc is not None:
+                doc.close()
+
+
+class ExtractionWorker(QThread):
+    """Worker thread for page extraction."""
+    progress = Signal(int, int)  # pages_added, total_to_add
+    finished = Signal(int)  # number of pages extracted
+    error = Signal(str)  # error message
+    
+    def __init__(self, pdf_path: str, output_path: str, pages_to_extract: list, preserve_order: bool):
+        super().__init__()
+        self.pdf_path = pdf_path
+        self.output_path = output_path
+        self.pages_to_extract = pages_to_extract
+        self.preserve_order = preserve_order
+    
+    def run(self):
+        try:
+            service = PdfExtractPagesService()
+            if self.preserve_order:
+                service.extract_pages_preserve_order(
+                    self.pdf_path,
+                    self.output_path,
+                    self.pages_to_extract,
+                    progress_callback=self._progress_callback
+                )
+            else:
+                service.extract_pages(
+                    self.pdf_path,
+                    self.output_path,
+                    self.pages_to_extract,
+                    progress_callback=self._progress_callback
+                )
+            self.finished.emit(len(self.pages_to_extract))
+        except Exception as e:
+            self.error.emit(str(e))
+    
+    def _progress_callback(self, current: int, total: int):
+        self.progress.emit(current, total)
+
+
 class PdfExtractPagesPage(QWidget):
     """Page for extracting pages from PDF files with visual selection."""
     
     THUMBNAIL_SIZE = 150  # Size of page thumbnails
     PREVIEW_WIDTH = 550   # Width of preview panel
+    PREVIEW_FIT_SIZE = (520, 720)  # Box a page is fitted into at 100% zoom
+    RENDER_THREADS = 3  # Concurrent thumbnail render workers
+    LARGE_PDF_PAGES = 200  # Above this page count only the first pages render in the background
+    LARGE_PDF_BYTES = 100 * 1024 * 1024  # Same policy for files above this size
+    EAGER_THUMBNAILS = 50  # Pages of a large PDF rendered without being scrolled to
     
     def __init__(self):
         super().__init__()
         self.selected_pdf = None
         self.total_pages = 0
-        self.page_thumbnails = []  # Store page pixmaps for preview
+        self._doc = None  # Open fitz document for on-demand rendering
+        self._thumbnail_disk_cache = ThumbnailDiskCache("pdf_thumbs")
+        self._thumbnail_cache_key = None  # Disk cache key of the loaded PDF
+        self._pixmap_key_prefix = ""  # QPixmapCache key prefix of the loaded PDF
+        self._background_pages = set()  # Pages rendered ahead of scrolling, not yet done
+        self.worker = None
+        self._is_extracting = False  # Extract button stays disabled while a worker runs
         self.current_preview_page = -1  # Currently previewed page
         self.zoom_level = 1.0  # Zoom level for preview
-        self._is_loading = False  # Flag to track if PDF is being loaded
+        self._load_generation = 0  # Bumped on every load/clear to drop stale results
+        self._render_queue = PageRenderQueue()
+        self._thread_pool = QThreadPool(self)
+        self._thread_pool.setMaxThreadCount(self.RENDER_THREADS)
+        self._render_signals = PageRenderSignals(self)
+        self._render_signals.pageReady.connect(self._on_thumbnail_ready)
+        self._render_signals.failed.connect(self._on_render_failed)
+        self._placeholder_icon = self._create_placeholder_icon()
+        
+        # Coalesce rapid zoom clicks into a single preview render
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(80)
+        self._zoom_timer.timeout.connect(self._update_preview)
         self._init_ui()
         
     def _init_ui(self):
@@ -236,8 +464,19 @@ class PdfExtractPagesPage(QWidget):
         self.pages_list.itemSelectionChanged.connect(self._update_selection_status)
         self.pages_list.itemClicked.connect(self._on_page_clicked)
         
+        # Render thumbnails only for the pages scrolled into view
+        self.pages_list.verticalScrollBar().valueChanged.connect(self._render_visible_thumbs)
+        self.pages_list.verticalScrollBar().rangeChanged.connect(self._render_visible_thumbs)
+        self.pages_list.viewport().installEventFilter(self)
+        
         group_layout.addWidget(self.pages_list)
         
+        # Shown while thumbnails off screen are still being rendered
+        self.thumbs_status_label = QLabel("⏳ Loading remaining thumbnails in background...")
+        self.thumbs_status_label.setStyleSheet("color: #7f8c8d; font-size: 12px;")
+        self.thumbs_status_label.setVisible(False)
+        group_layout.addWidget(self.thumbs_status_label)
+        
         # Options row
         options_layout = QHBoxLayout()
         self.preserve_order_checkbox = QCheckBox("Extract pages in selection order (instead of page number order)")
@@ -344,9 +583,6 @@ class PdfExtractPagesPage(QWidget):
     
     def _drag_enter_event(self, event):
         """Handle drag enter event for file drops."""
-        if self._is_loading:
-            event.ignore()
-            return
         if event.mimeData().hasUrls():
             for url in event.mimeData().urls():
                 if url.toLocalFile().lower().endswith('.pdf'):
@@ -356,9 +592,6 @@ class PdfExtractPagesPage(QWidget):
     
     def _drag_move_event(self, event):
         """Handle drag move event for file drops."""
-        if self._is_loading:
-            event.ignore()
-            return
         if event.mimeData().hasUrls():
             for url in event.mimeData().urls():
                 if url.toLocalFile().lower().endswith('.pdf'):
@@ -368,9 +601,6 @@ class PdfExtractPagesPage(QWidget):
     
     def _drop_event(self, event):
         """Handle drop event for file drops."""
-        if self._is_loading:
-            event.ignore()
-            return
         if event.mimeData().hasUrls():
             for url in event.mimeData().urls():
                 file_path = url.toLocalFile()
@@ -382,14 +612,12 @@ class PdfExtractPagesPage(QWidget):
     
     def _drop_zone_clicked(self, event):
         """Handle click on drop zone to open file browser."""
-        # Only trigger browse if no file is loaded and not currently loading
-        if self.selected_pdf is None and not self._is_loading:
+        # Only trigger browse if no file is loaded
+        if self.selected_pdf is None:
             self._select_pdf()
     
     def _select_pdf(self):
         """Open file dialog to select a PDF."""
-        if self._is_loading:
-            return
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Select PDF File",
@@ -402,11 +630,10 @@ class PdfExtractPagesPage(QWidget):
     
     def _clear_pdf(self):
         """Clear the loaded PDF."""
-        if self._is_loading:
-            return
+        self._cancel_rendering()
+        self._close_document()
         self.selected_pdf = None
         self.total_pages = 0
-        self.page_thumbnails.clear()
         self.pages_list.clear()
         self.content_splitter.setVisible(False)
         self.clear_button.setVisible(False)
@@ -421,62 +648,53 @@ class PdfExtractPagesPage(QWidget):
         self.status_label.setVisible(False)
     
     def _load_pdf(self, file_path: str):
-        """Load a PDF file and display page thumbnails."""
-        if self._is_loading:
-            return
-        
-        self._is_loading = True
-        self.selected_pdf = file_path
-        self.file_label.setText(f"⏳ Loading {Path(file_path).name}...")
-        self.file_label.setStyleSheet("color: #2c3e50; font-style: normal; font-weight: bold; border: none; background: transparent;")
-        self.clear_button.setVisible(False)  # Disable clear while loading
-        # Change cursor since file is being loaded
-        self.drop_zone.setCursor(Qt.CursorShape.ArrowCursor)
+        """
+        Load a PDF file and list its pages.
         
-        # Clear previous data
-        self.pages_list.clear()
-        self.page_thumbnails.clear()
-        
-        # Show progress
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setValue(0)
+        Only page placeholders are created here, without re-entering the
+        event loop; thumbnails arrive later through the pageReady signal.
+        """
+        # Clear previous data and drop any renders still running
+        self._clear_pdf()
         
         try:
             if not HAS_FITZ:
                 QMessageBox.warning(self, "Warning", "PyMuPDF (fitz) is required for page thumbnails.\nInstall it with: pip install pymupdf")
-                self.progress_bar.setVisible(False)
                 return
             
-            doc = fitz.open(file_path)
-            self.total_pages = doc.page_count
-            self.progress_bar.setMaximum(self.total_pages)
-            
+            file_size = Path(file_path).stat().st_size
+            self._doc = fitz.open(file_path)
+            self.total_pages = self._doc.page_count
+        except Exception as e:
+            self._clear_pdf()
+            QMessageBox.warning(self, "Warning", f"Could not read PDF:\n{str(e)}")
+            return
+        
+        self.selected_pdf = file_path
+        
+        # Small documents get every thumbnail rendered in the background; large
+        # ones only the first pages, the rest as they are scrolled into view
+        if self.total_pages > self.LARGE_PDF_PAGES or file_size > self.LARGE_PDF_BYTES:
+            self._background_pages = set(range(min(self.EAGER_THUMBNAILS, self.total_pages)))
+        else:
+            self._background_pages = set(range(self.total_pages))
+        
+        # Thumbnails of a file seen before are reused from the disk cache
+        try:
+            self._thumbnail_cache_key = ThumbnailDiskCache.file_key(file_path)
+        except OSError:
+            self._thumbnail_cache_key = None
+        QThreadPool.globalInstance().start(self._thumbnail_disk_cache.evict)
+        # In-memory pixmaps live in the app-wide QPixmapCache under the same file identity
+        self._pixmap_key_prefix = f"pdfext:{self._thumbnail_cache_key or file_path}"
+        
+        # Add a placeholder entry per page; real thumbnails are rendered lazily.
+        # Repaints are suspended so the view lays items out once, not per insert.
+        self.pages_list.setUpdatesEnabled(False)
+        self.pages_list.setSortingEnabled(False)
+        try:
             for page_num in range(self.total_pages):
-                page = doc[page_num]
-                
-                # Create thumbnail
-                mat = fitz.Matrix(0.3, 0.3)  # Scale for thumbnail
-                pix = page.get_pixmap(matrix=mat)
-                img = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format.Format_RGB888)
-                thumbnail_pixmap = QPixmap.fromImage(img)
-                
-                # Scale to consistent thumbnail size
-                scaled_thumb = thumbnail_pixmap.scaled(
-                    self.THUMBNAIL_SIZE,
-                    self.THUMBNAIL_SIZE,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                
-                # Create larger preview
-                mat_preview = fitz.Matrix(1.0, 1.0)  # Larger for preview
-                pix_preview = page.get_pixmap(matrix=mat_preview)
-                img_preview = QImage(pix_preview.samples, pix_preview.width, pix_preview.height, pix_preview.stride, QImage.Format.Format_RGB888)
-                preview_pixmap = QPixmap.fromImage(img_preview)
-                self.page_thumbnails.append(preview_pixmap)
-                
-                # Add to list
-                item = QListWidgetItem(QIcon(scaled_thumb), f"Page {page_num + 1}")
+                item = QListWidgetItem(self._placeholder_icon, f"Page {page_num + 1}")
                 item.setData(Qt.ItemDataRole.UserRole, page_num)
                 item.setSizeHint(QSize(self.THUMBNAIL_SIZE + 20, self.THUMBNAIL_SIZE + 40))
                 # Make label bold for better visibility
@@ -484,26 +702,152 @@ class PdfExtractPagesPage(QWidget):
                 font.setBold(True)
                 item.setFont(font)
                 self.pages_list.addItem(item)
-                
-                self.progress_bar.setValue(page_num + 1)
-                
-                # Process events to keep UI responsive
-                QApplication.processEvents()
-                
-            doc.close()
-            
-            self.file_label.setText(f"📄 {Path(file_path).name}")
-            self.clear_button.setVisible(True)
-            self.content_splitter.setVisible(True)
-            self._update_selection_status()
-            self.progress_bar.setVisible(False)
-            
-        except Exception as e:
-            QMessageBox.warning(self, "Warning", f"Could not read PDF:\n{str(e)}")
-            self.selected_pdf = None
-            self.progress_bar.setVisible(False)
         finally:
-            self._is_loading = False
+            self.pages_list.setUpdatesEnabled(True)
+            self.pages_list.doItemsLayout()
+        
+        self.content_splitter.setVisible(True)
+        self._update_selection_status()
+        self.file_label.setText(f"📄 {Path(file_path).name}")
+        self.file_label.setStyleSheet("color: #2c3e50; font-style: normal; font-weight: bold; border: none; background: transparent;")
+        self.clear_button.setVisible(True)
+        # Clicking the drop zone no longer browses once a file is loaded
+        self.drop_zone.setCursor(Qt.CursorShape.ArrowCursor)
+        
+        # Layout happens on the next event loop pass; render what is visible then
+        QTimer.singleShot(0, self._render_visible_thumbs)
+    
+    def closeEvent(self, event):
+        """Stop render workers, wait for a running extraction and release the open document."""
+        self._cancel_rendering()
+        self._thread_pool.waitForDone()
+        if self.worker is not None and self.worker.isRunning():
+            self.worker.wait()  # Let an in-flight extraction finish writing its output
+        self._close_document()
+        super().closeEvent(event)
+    
+    def _create_placeholder_icon(self):
+        """Create the gray icon shown until a page thumbnail is rendered."""
+        pixmap = QPixmap(self.THUMBNAIL_SIZE, self.THUMBNAIL_SIZE)
+        pixmap.fill(QColor("#dfe3e6"))
+        return QIcon(pixmap)
+    
+    def _close_document(self):
+        """Close the open fitz document."""
+        if self._doc is not None:
+            self._doc.close()
+            self._doc = None
+        self.current_preview_page = -1
+    
+    def _cancel_rendering(self):
+        """Stop background renders belonging to the previous load."""
+        self._render_queue.close()
+        self._thread_pool.clear()
+        self._render_queue = PageRenderQueue()
+        self._load_generation += 1
+        self._background_pages = set()
+        self.thumbs_status_label.setVisible(False)
+    
+    def eventFilter(self, obj, event):
+        """Render newly exposed thumbnails when the pages list is resized."""
+        if obj is self.pages_list.viewport() and event.type() == QEvent.Type.Resize:
+            QTimer.singleShot(0, self._render_visible_thumbs)
+        return super().eventFilter(obj, event)
+    
+    def _visible_page_range(self):
+        """Return the (first, last) page indices currently shown in the pages list."""
+        count = self.pages_list.count()
+        if count == 0:
+            return None
+        
+        viewport_height = self.pages_list.viewport().height()
+        
+        # Items are laid out in page order, so binary search the first and last visible rows
+        low, high = 0, count
+        while low < high:
+            mid = (low + high) // 2
+            if self.pages_list.visualItemRect(self.pages_list.item(mid)).bottom() < 0:
+                low = mid + 1
+            else:
+                high = mid
+        first = low
+        
+        low, high = first, count
+        while low < high:
+            mid = (low + high) // 2
+            if self.pages_list.visualItemRect(self.pages_list.item(mid)).top() <= viewport_height:
+                low = mid + 1
+            else:
+                high = mid
+        last = low - 1
+        
+        if first > last:
+            return None
+        return first, last
+    
+    def _render_visible_thumbs(self, *args):
+        """Queue background renders for visible and eager pages that have no thumbnail yet."""
+        if self._doc is None:
+            return
+        
+        # Pages nearest the middle of the viewport render first, then the
+        # remaining background pages in page order
+        priorities = {page_num: self.total_pages + page_num for page_num in self._background_pages}
+        visible = self._visible_page_range()
+        if visible is not None:
+            first, last = visible
+            center = (first + last) / 2
+            for page_num in range(first, last + 1):
+                priorities[page_num] = abs(page_num - center)
+        
+        entries = []
+        for page_num, priority in priorities.items():
+            pixmap = QPixmapCache.find(self._pixmap_key(page_num, "thumb"))
+            if pixmap is None:
+                entries.append((priority, page_num))
+            elif self._render_queue.claim(page_num):
+                self._set_thumbnail(page_num, pixmap)
+        self.thumbs_status_label.setVisible(bool(self._background_pages))
+        
+        new_workers = self._render_queue.schedule(entries, self.RENDER_THREADS)
+        for _ in range(new_workers):
+            self._thread_pool.start(PageRenderWorker(
+                self.selected_pdf,
+                self._render_queue,
+                self.THUMBNAIL_SIZE,
+                self._load_generation,
+                self._render_signals,
+                self._thumbnail_disk_cache,
+                self._thumbnail_cache_key
+            ))
+    
+    def _on_thumbnail_ready(self, generation: int, page_num: int, image: QImage):
+        """Convert a rendered thumbnail to a QPixmap once, on the UI thread."""
+        if generation != self._load_generation:
+            return
+        
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(self._pixmap_key(page_num, "thumb"), pixmap)
+        self._set_thumbnail(page_num, pixmap)
+    
+    def _set_thumbnail(self, page_num: int, pixmap: QPixmap):
+        """Show a page's thumbnail and hide the background banner once all are in."""
+        self.pages_list.item(page_num).setIcon(QIcon(pixmap))
+        self._background_pages.discard(page_num)
+        if not self._background_pages:
+            self.thumbs_status_label.setVisible(False)
+    
+    def _pixmap_key(self, page_num: int, kind: str) -> str:
+        """Build the QPixmapCache key for a page of the loaded PDF."""
+        return f"{self._pixmap_key_prefix}:{page_num}:{kind}"
+    
+    def _on_render_failed(self, generation: int, message: str):
+        """Handle a background render error."""
+        if generation != self._load_generation:
+            return
+        
+        self._clear_pdf()
+        QMessageBox.warning(self, "Warning", f"Could not read PDF:\n{message}")
     
     def _on_page_clicked(self, item):
         """Handle page click for preview."""
@@ -518,22 +862,25 @@ class PdfExtractPagesPage(QWidget):
     
     def _update_preview(self):
         """Update the preview with current zoom level."""
-        if self.current_preview_page < 0 or self.current_preview_page >= len(self.page_thumbnails):
+        if self._doc is None or self.current_preview_page < 0 or self.current_preview_page >= self.total_pages:
             return
         
-        preview = self.page_thumbnails[self.current_preview_page]
-        # Apply zoom to base size
-        base_width, base_height = 520, 720
-        scaled_width = int(base_width * self.zoom_level)
-        scaled_height = int(base_height * self.zoom_level)
+        cache_key = self._pixmap_key(self.current_preview_page, f"preview@{self.zoom_level:.2f}")
+        preview = QPixmapCache.find(cache_key)
+        if preview is None:
+            page = self._doc[self.current_preview_page]
+            # Rasterize directly at the zoomed size instead of scaling a fixed render
+            fit_width, fit_height = self.PREVIEW_FIT_SIZE
+            scale = min(fit_width / page.rect.width, fit_height / page.rect.height) * self.zoom_level
+            pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale))
+            arr = _fitz_pixmap_to_ndarray(pix)
+            img = _ndarray_to_qimage(arr)
+            # fromImage copies the pixels, so pix may be freed after this
+            preview = QPixmap.fromImage(img)
+            QPixmapCache.insert(cache_key, preview)
         
-        scaled = preview.scaled(
-            scaled_width, scaled_height,
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        )
-        self.preview_label.setPixmap(scaled)
-        self.preview_label.setFixedSize(scaled.size())
+        self.preview_label.setPixmap(preview)
+        self.preview_label.setFixedSize(preview.size())
         self.preview_label.setStyleSheet("")
     
     def _zoom_in(self):
@@ -541,24 +888,24 @@ class PdfExtractPagesPage(QWidget):
         if self.zoom_level < 3.0:
             self.zoom_level += 0.25
             self.zoom_label.setText(f"{int(self.zoom_level * 100)}%")
-            self._update_preview()
+            self._zoom_timer.start()
     
     def _zoom_out(self):
         """Zoom out the preview."""
         if self.zoom_level > 0.25:
             self.zoom_level -= 0.25
             self.zoom_label.setText(f"{int(self.zoom_level * 100)}%")
-            self._update_preview()
+            self._zoom_timer.start()
     
     def _zoom_reset(self):
         """Reset zoom to fit."""
         self.zoom_level = 1.0
         self.zoom_label.setText("100%")
-        self._update_preview()
+        self._zoom_timer.start()
     
     def _update_selection_status(self):
         """Update the selection status label and button state."""
-        selected_count = len(self.pages_list.selectedItems())
+        selected_count = len(self.pages_list.selectionModel().selectedIndexes())
         
         if selected_count == 0:
             self.selection_label.setText("No pages selected for extraction")
@@ -568,21 +915,35 @@ class PdfExtractPagesPage(QWidget):
             self.selection_label.setStyleSheet("color: #9b59b6; font-weight: bold;")
         
         # Enable extract button only if at least one page is selected
-        self.extract_button.setEnabled(selected_count > 0)
+        self.extract_button.setEnabled(selected_count > 0 and not self._is_extracting)
     
     def _select_all_pages(self):
         """Select all pages."""
+        self.pages_list.blockSignals(True)
         self.pages_list.selectAll()
+        self.pages_list.blockSignals(False)
+        self._update_selection_status()
     
     def _deselect_all_pages(self):
         """Deselect all pages."""
+        self.pages_list.blockSignals(True)
         self.pages_list.clearSelection()
+        self.pages_list.blockSignals(False)
+        self._update_selection_status()
     
     def _invert_selection(self):
         """Invert the current selection."""
-        for i in range(self.pages_list.count()):
-            item = self.pages_list.item(i)
-            item.setSelected(not item.isSelected())
+        count = self.pages_list.count()
+        if count == 0:
+            return
+        
+        # Toggle every row in one selection-model update instead of one signal per item
+        model = self.pages_list.model()
+        full_range = QItemSelection(model.index(0, 0), model.index(count - 1, 0))
+        self.pages_list.blockSignals(True)
+        self.pages_list.selectionModel().select(full_range, QItemSelectionModel.SelectionFlag.Toggle)
+        self.pages_list.blockSignals(False)
+        self._update_selection_status()
     
     def _extract_pages(self):
         """Extract the selected pages from the PDF."""
@@ -618,53 +979,60 @@ class PdfExtractPagesPage(QWidget):
         self._perform_extract(pages_to_extract, output_file, preserve_order)
     
     def _perform_extract(self, pages_to_extract: list, output_file: str, preserve_order: bool):
-        """Perform the page extraction."""
+        """Perform the page extraction on a worker thread."""
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
-        self.progress_bar.setMaximum(100)
+        self.progress_bar.setMaximum(len(pages_to_extract))
         self.status_label.setVisible(False)
+        self._is_extracting = True
         self.extract_button.setEnabled(False)
         
-        try:
-            service = PdfExtractPagesService()
-            
-            if preserve_order:
-                service.extract_pages_preserve_order(
-                    self.selected_pdf,
-                    output_file,
-                    pages_to_extract
-                )
-            else:
-                service.extract_pages(
-                    self.selected_pdf,
-                    output_file,
-                    pages_to_extract
-                )
-            
-            self.progress_bar.setValue(100)
-            
-            self.status_label.setText(f"✅ Extracted {len(pages_to_extract)} page(s) to new PDF.")
-            self.status_label.setStyleSheet("color: #27ae60; font-weight: bold;")
-            self.status_label.setVisible(True)
-            
-            # Ask if user wants to open the extracted PDF
-            reply = QMessageBox.question(
-                self,
-                "Success",
-                f"Pages extracted successfully!\n\nOpen the new PDF now?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-            )
-            
-            if reply == QMessageBox.StandardButton.Yes:
-                import os
-                os.startfile(output_file)
-                
-        except Exception as e:
-            self.status_label.setText(f"❌ Error: {str(e)}")
-            self.status_label.setStyleSheet("color: #e74c3c; font-weight: bold;")
-            self.status_label.setVisible(True)
-            QMessageBox.critical(self, "Error", f"Failed to extract pages:\n{str(e)}")
+        # Create and start worker thread
+        self.worker = ExtractionWorker(
+            self.selected_pdf,
+            output_file,
+            pages_to_extract,
+            preserve_order
+        )
+        self.worker.progress.connect(self._on_progress)
+        self.worker.finished.connect(lambda count: self._on_finished(count, output_file))
+        self.worker.error.connect(self._on_error)
+        self.worker.start()
+    
+    def _on_progress(self, current: int, total: int):
+        """Handle progress updates."""
+        self.progress_bar.setValue(current)
+        self.progress_bar.setFormat(f"Extracting page {current}/{total}...")
+    
+    def _on_finished(self, count: int, output_file: str):
+        """Handle extraction completion."""
+        self.progress_bar.setVisible(False)
+        self._is_extracting = False
+        self._update_selection_status()
         
-        finally:
-            self.extract_button.setEnabled(True)
-            self.progress_bar.setVisible(False)
+        self.status_label.setText(f"✅ Extracted {count} page(s) to new PDF.")
+        self.status_label.setStyleSheet("color: #27ae60; font-weight: bold;")
+        self.status_label.setVisible(True)
+        
+        # Ask if user wants to open the extracted PDF
+        reply = QMessageBox.question(
+            self,
+            "Success",
+            f"Pages extracted successfully!\n\nOpen the new PDF now?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        
+        if reply == QMessageBox.StandardButton.Yes:
+            # Hands off to the platform's default viewer and returns immediately
+            QDesktopServices.openUrl(QUrl.fromLocalFile(output_file))
+    
+    def _on_error(self, error_message: str):
+        """Handle extraction error."""
+        self.progress_bar.setVisible(False)
+        self._is_extracting = False
+        self._update_selection_status()
+        
+        self.status_label.setText(f"❌ Error: {error_message}")
+        self.status_label.setStyleSheet("color: #e74c3c; font-weight: bold;")
+        self.status_label.setVisible(True)
+        QMessageBox.critical(self, "Error", f"Failed to extract pages:\n{error_message}")
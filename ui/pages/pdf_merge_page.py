@@ -2,16 +2,22 @@
 PDF Merge page.
 Allows users to select multiple PDF files and merge them into one.
 """
+import multiprocessing
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QListWidget,
     QLabel, QGroupBox, QFileDialog, QProgressBar, QMessageBox,
-    QListWidgetItem, QAbstractItemView, QListView, QApplication
+    QListWidgetItem, QAbstractItemView, QListView
 )
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import Qt, QSize, QModelIndex, QObject, QRunnable, QThread, QThreadPool, QTimer, QEvent, Signal
 from PySide6.QtGui import QIcon, QPixmap, QImage, QFont
 
-from services.pdf_merge_service import PdfMergeService
+from services.pdf_merge_service import PdfMergeService, render_first_page
+from utils.thumbnail_cache import ThumbnailDiskCache
 
 # Try to import fitz (PyMuPDF) for PDF thumbnails
 try:
@@ -21,15 +27,151 @@ except ImportError:
     HAS_FITZ = False
 
 
+class ThumbnailSignals(QObject):
+    """Signals used by thumbnail jobs to report back to the UI thread."""
+    
+    finished = Signal(str, QImage)  # pdf_path, thumbnail (null image on failure)
+    process_pool_broken = Signal(object)  # the ProcessPoolExecutor that can no longer run jobs
+
+
+class ThumbnailJob(QRunnable):
+    """Job that renders the first page of a PDF as a thumbnail image."""
+    
+    def __init__(
+        self,
+        pdf_path: str,
+        thumbnail_size: int,
+        signals: ThumbnailSignals,
+        disk_cache: ThumbnailDiskCache,
+        process_pool: ProcessPoolExecutor = None
+    ):
+        super().__init__()
+        self.pdf_path = pdf_path
+        self.thumbnail_size = thumbnail_size
+        self.signals = signals
+        self.disk_cache = disk_cache
+        self.process_pool = process_pool  # Decode in a worker process when set
+    
+    def run(self):
+        """Render the thumbnail in a background thread."""
+        # Only QImage is used here; QPixmap may only be created on the UI thread
+        image = QImage()
+        try:
+            # A file added before is decoded from the disk cache instead of re-rendered
+            cache_key = ThumbnailDiskCache.file_key(self.pdf_path, self.thumbnail_size)
+            cached = self.disk_cache.load(cache_key, 0)
+            if cached is not None:
+                self.signals.finished.emit(self.pdf_path, cached)
+                return
+            
+            if self.process_pool is not None:
+                image = self._render_in_process()
+            else:
+                image = self._render_in_thread()
+            
+            if not image.isNull():
+                self.disk_cache.save(cache_key, 0, image)
+        except Exception as e:
+            print(f"Error creating PDF thumbnail for {self.pdf_path}: {e}")
+        
+        self.signals.finished.emit(self.pdf_path, image)
+    
+    def _render_in_process(self) -> QImage:
+        """Render in the process pool, falling back to this thread if the pool has broken."""
+        try:
+            # MuPDF holds the GIL while rendering; a process pool keeps all cores busy
+            samples, width, height, stride, page_count = self.process_pool.submit(
+                render_first_page, self.pdf_path, self.thumbnail_size
+            ).result()
+        except BrokenProcessPool:
+            # A worker died (e.g. a MuPDF crash or an OOM kill); every later submit
+            # would fail too, so have the page replace the pool for the next batch
+            self.signals.process_pool_broken.emit(self.process_pool)
+            return self._render_in_thread()
+        
+        if page_count == 0:
+            return QImage()
+        return QImage(samples, width, height, stride, QImage.Format.Format_RGB888).copy()
+    
+    def _render_in_thread(self) -> QImage:
+        """Render the first page with MuPDF on the current thread."""
+        doc = fitz.open(self.pdf_path)
+        try:
+            if doc.page_count == 0:
+                return QImage()
+            
+            page = doc[0]
+            # Rasterize straight to thumbnail size so no rescale is needed
+            scale = self.thumbnail_size / max(page.rect.width, page.rect.height)
+            pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale), alpha=False, colorspace=fitz.csRGB)
+            # samples_mv is a view of the pixmap buffer, not a bytes copy;
+            # copy() then detaches the image so pix can be freed
+            img = QImage(pix.samples_mv, pix.width, pix.height, pix.stride, QImage.Format.Format_RGB888)
+            image = img.copy()
+            # Free the decoded samples now rather than when this returns
+            del img, pix
+            return image
+        finally:
+            doc.close()
+
+
+class MergeWorker(QThread):
+    """Worker thread for PDF merging."""
+    progress = Signal(int, int)  # files_added, total_files
+    finished = Signal(bool)  # success
+    error = Signal(str)  # error message
+    
+    def __init__(self, pdf_paths: list, output_path: str):
+        super().__init__()
+        self.pdf_paths = pdf_paths
+        self.output_path = output_path
+    
+    def run(self):
+        try:
+            service = PdfMergeService()
+            success = service.merge_pdfs(
+                self.pdf_paths,
+                self.output_path,
+                progress_callback=self._progress_callback
+            )
+            self.finished.emit(success)
+        except Exception as e:
+            self.error.emit(str(e))
+    
+    def _progress_callback(self, current: int, total: int):
+        self.progress.emit(current, total)
+
+
 class PdfMergePage(QWidget):
     """Page for merging multiple PDF files."""
     
     THUMBNAIL_SIZE = 120  # Size of PDF preview thumbnails
+    THUMBNAIL_MEMO_SIZE = 256  # Thumbnails kept in memory for re-adds within a session
+    PROCESS_POOL_MIN_FILES = 16  # Render batches at least this large decode in worker processes
+    THUMBNAIL_REQUESTED_ROLE = Qt.ItemDataRole.UserRole + 1  # True once a thumbnail is shown or being rendered
     
     def __init__(self):
         super().__init__()
         self.pdf_files = []  # List to store selected PDF file paths
-        self._is_loading = False  # Flag to track if files are being loaded
+        self._pdf_set = set()  # Same paths as pdf_files, for O(1) duplicate checks
+        self._pending_thumbnails = {}  # pdf_path -> (list item, memo key) still showing the placeholder
+        self._thumbnail_memo = OrderedDict()  # (path, mtime_ns, size) -> QIcon
+        self._process_pool = None  # Created on the first large render batch
+        self.worker = None
+        self._is_merging = False  # Merge button stays disabled while a worker runs
+        self._placeholder_icon = self._create_placeholder_icon()  # Shared by every item until its thumbnail loads
+        
+        # Range selections emit one selection change per item; coalesce them into one update
+        self._button_state_timer = QTimer(self)
+        self._button_state_timer.setSingleShot(True)
+        self._button_state_timer.setInterval(0)
+        self._button_state_timer.timeout.connect(self._update_button_states)
+        self._thumbnail_disk_cache = ThumbnailDiskCache("pdf_thumbs")
+        self._thread_pool = QThreadPool(self)
+        self._thread_pool.setMaxThreadCount(os.cpu_count() or 1)
+        self._thumbnail_signals = ThumbnailSignals(self)
+        self._thumbnail_signals.finished.connect(self._on_thumbnail_ready)
+        self._thumbnail_signals.process_pool_broken.connect(self._on_process_pool_broken)
         self._init_ui()
         
     def _init_ui(self):
@@ -165,7 +307,12 @@ class PdfMergePage(QWidget):
                 background-color: #d5dbdb;
             }
         """)
-        self.pdf_list.itemSelectionChanged.connect(self._update_button_states)
+        self.pdf_list.itemSelectionChanged.connect(self._button_state_timer.start)
+        
+        # Render thumbnails only for the files scrolled into view
+        self.pdf_list.verticalScrollBar().valueChanged.connect(self._render_visible_thumbs)
+        self.pdf_list.verticalScrollBar().rangeChanged.connect(self._render_visible_thumbs)
+        self.pdf_list.viewport().installEventFilter(self)
         
         # Set up external file drop handling
         self.pdf_list.dragEnterEvent = self._drag_enter_event
@@ -198,16 +345,11 @@ class PdfMergePage(QWidget):
     
     def _drop_event(self, event):
         """Handle drop event for external file drops."""
-        # Ignore drops while loading
-        if self._is_loading:
-            event.ignore()
-            return
-            
         if event.mimeData().hasUrls():
             files = []
             for url in event.mimeData().urls():
                 file_path = url.toLocalFile()
-                if file_path.lower().endswith('.pdf'):
+                if Path(file_path).suffix.lower() == '.pdf':
                     files.append(file_path)
             
             if files:
@@ -218,10 +360,6 @@ class PdfMergePage(QWidget):
     
     def _add_pdfs(self):
         """Open file dialog to add PDFs."""
-        # Prevent adding files while loading
-        if self._is_loading:
-            return
-            
         files, _ = QFileDialog.getOpenFileNames(
             self,
             "Select PDF Files",
@@ -232,38 +370,44 @@ class PdfMergePage(QWidget):
         if files:
             self._add_pdf_files(files)
     
-    def _create_pdf_thumbnail(self, pdf_path: str) -> QIcon:
-        """Create a thumbnail from the first page of a PDF."""
-        if not HAS_FITZ:
-            # Return a default PDF icon if PyMuPDF is not available
-            return self._create_placeholder_icon()
+    def _on_thumbnail_ready(self, pdf_path: str, image: QImage):
+        """Swap a placeholder for the rendered thumbnail on the UI thread."""
+        pending = self._pending_thumbnails.pop(pdf_path, None)
+        if pending is None or image.isNull():
+            return
         
+        item, memo_key = pending
+        icon = QIcon(QPixmap.fromImage(image))
+        if memo_key is not None:
+            self._thumbnail_memo[memo_key] = icon
+            if len(self._thumbnail_memo) > self.THUMBNAIL_MEMO_SIZE:
+                self._thumbnail_memo.popitem(last=False)
+        item.setIcon(icon)
+    
+    def _on_process_pool_broken(self, process_pool: ProcessPoolExecutor):
+        """Drop a broken process pool so the next large batch starts a fresh one."""
+        # Every job of the failed batch reports it; only the first one still matches
+        if process_pool is self._process_pool:
+            process_pool.shutdown(wait=False)
+            self._process_pool = None
+    
+    def _thumbnail_memo_key(self, pdf_path: str):
+        """Identify a file version for the in-memory thumbnail memo, or None if it cannot be read."""
         try:
-            doc = fitz.open(pdf_path)
-            if doc.page_count > 0:
-                page = doc[0]
-                # Render at a reasonable resolution for thumbnail
-                mat = fitz.Matrix(0.5, 0.5)  # Scale down
-                pix = page.get_pixmap(matrix=mat)
-                
-                # Convert to QImage then QPixmap
-                img = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format.Format_RGB888)
-                pixmap = QPixmap.fromImage(img)
-                
-                # Scale to thumbnail size
-                scaled = pixmap.scaled(
-                    self.THUMBNAIL_SIZE,
-                    self.THUMBNAIL_SIZE,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                doc.close()
-                return QIcon(scaled)
-            doc.close()
-        except Exception as e:
-            print(f"Error creating PDF thumbnail for {pdf_path}: {e}")
-        
-        return self._create_placeholder_icon()
+            stat = os.stat(pdf_path)
+        except OSError:
+            return None
+        return (pdf_path, stat.st_mtime_ns, stat.st_size)
+    
+    def closeEvent(self, event):
+        """Shut down the thumbnail worker processes when the page is closed."""
+        self._thread_pool.clear()  # Drop jobs that have not started yet
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+        if self.worker is not None and self.worker.isRunning():
+            self.worker.wait()  # Let an in-flight merge finish writing its output
+        super().closeEvent(event)
     
     def _create_placeholder_icon(self) -> QIcon:
         """Create a placeholder icon for PDFs without thumbnails."""
@@ -273,68 +417,136 @@ class PdfMergePage(QWidget):
         return QIcon(pixmap)
     
     def _add_pdf_files(self, files: list):
-        """Add PDF files to the list with thumbnails."""
-        # Prevent concurrent loading
-        if self._is_loading:
-            return
-        
-        self._is_loading = True
-        self._set_loading_ui_state(True)
-        
+        """Add PDF files to the list; thumbnails render once they are scrolled into view."""
+        # Suspend list repaints so the view lays the batch out once, not per insert
+        self.pdf_list.setUpdatesEnabled(False)
+        self.pdf_list.setSortingEnabled(False)
         try:
             for file_path in files:
-                if file_path not in self.pdf_files:
-                    self.pdf_files.append(file_path)
-                    
-                    # Create thumbnail from first page
-                    thumbnail = self._create_pdf_thumbnail(file_path)
-                    filename = Path(file_path).name
-                    
-                    # Truncate long filenames
-                    display_name = filename if len(filename) <= 18 else filename[:15] + "..."
-                    
-                    item = QListWidgetItem(thumbnail, display_name)
-                    item.setData(Qt.ItemDataRole.UserRole, file_path)
-                    item.setToolTip(filename)  # Show full name on hover
-                    item.setSizeHint(QSize(self.THUMBNAIL_SIZE + 20, self.THUMBNAIL_SIZE + 40))
-                    # Make label bold for better visibility
-                    font = item.font()
-                    font.setBold(True)
-                    item.setFont(font)
-                    self.pdf_list.addItem(item)
-                    
-                    # Process events to keep UI responsive during thumbnail generation
-                    QApplication.processEvents()
+                if file_path in self._pdf_set:
+                    continue
+                self._pdf_set.add(file_path)
+                self.pdf_files.append(file_path)
+                
+                filename = Path(file_path).name
+                
+                # Truncate long filenames
+                display_name = filename if len(filename) <= 18 else filename[:15] + "..."
+                
+                item = QListWidgetItem(self._placeholder_icon, display_name)
+                item.setData(Qt.ItemDataRole.UserRole, file_path)
+                item.setToolTip(filename)  # Show full name on hover
+                item.setSizeHint(QSize(self.THUMBNAIL_SIZE + 20, self.THUMBNAIL_SIZE + 40))
+                # Make label bold for better visibility
+                font = item.font()
+                font.setBold(True)
+                item.setFont(font)
+                self.pdf_list.addItem(item)
+                
+                # Reuse a thumbnail rendered earlier this session; others wait for the viewport
+                memo_key = self._thumbnail_memo_key(file_path)
+                icon = self._thumbnail_memo.get(memo_key)
+                if icon is not None:
+                    self._thumbnail_memo.move_to_end(memo_key)
+                    item.setIcon(icon)
+                item.setData(self.THUMBNAIL_REQUESTED_ROLE, icon is not None or not HAS_FITZ)
         finally:
-            self._is_loading = False
-            self._set_loading_ui_state(False)
+            self.pdf_list.setUpdatesEnabled(True)
+            self.pdf_list.doItemsLayout()
         
+        # Trim the shared thumbnail cache back to its budget in the background
+        QThreadPool.globalInstance().start(self._thumbnail_disk_cache.evict)
         self._update_button_states()
         self._update_drop_hint_visibility()
+        
+        # Layout happens on the next event loop pass; render what is visible then
+        QTimer.singleShot(0, self._render_visible_thumbs)
     
-    def _set_loading_ui_state(self, loading: bool):
-        """Enable or disable UI elements during file loading."""
-        # Disable/enable buttons during loading
-        self.add_files_button.setEnabled(not loading)
-        self.remove_files_button.setEnabled(not loading and len(self.pdf_list.selectedItems()) > 0)
-        self.clear_files_button.setEnabled(not loading and self.pdf_list.count() > 0)
-        self.move_up_button.setEnabled(not loading)
-        self.move_down_button.setEnabled(not loading)
-        self.merge_button.setEnabled(not loading and self.pdf_list.count() > 1)
-        
-        # Update button text to show loading state
-        if loading:
-            self.add_files_button.setText("⏳ Loading...")
-        else:
-            self.add_files_button.setText("➕ Add PDFs")
+    def eventFilter(self, obj, event):
+        """Render newly exposed thumbnails when the list is resized."""
+        if obj is self.pdf_list.viewport() and event.type() == QEvent.Type.Resize:
+            QTimer.singleShot(0, self._render_visible_thumbs)
+        return super().eventFilter(obj, event)
+    
+    def _visible_row_range(self):
+        """Return the (first, last) rows currently shown in the PDF list."""
+        count = self.pdf_list.count()
+        if count == 0:
+            return None
+        
+        viewport_height = self.pdf_list.viewport().height()
+        
+        # The grid fills row by row in list order, so binary search the first and last visible items
+        low, high = 0, count
+        while low < high:
+            mid = (low + high) // 2
+            if self.pdf_list.visualItemRect(self.pdf_list.item(mid)).bottom() < 0:
+                low = mid + 1
+            else:
+                high = mid
+        first = low
+        
+        low, high = first, count
+        while low < high:
+            mid = (low + high) // 2
+            if self.pdf_list.visualItemRect(self.pdf_list.item(mid)).top() <= viewport_height:
+                low = mid + 1
+            else:
+                high = mid
+        last = low - 1
+        
+        if first > last:
+            return None
+        return first, last
+    
+    def _render_visible_thumbs(self, *args):
+        """Start thumbnail jobs for visible files that still show the placeholder."""
+        visible = self._visible_row_range()
+        if visible is None:
+            return
+        
+        first, last = visible
+        to_render = []
+        for row in range(first, last + 1):
+            item = self.pdf_list.item(row)
+            if not item.data(self.THUMBNAIL_REQUESTED_ROLE):
+                to_render.append(item)
+        
+        if not to_render:
+            return
+        
+        # Large batches decode in worker processes; small ones are not worth the process startup
+        process_pool = None
+        if len(to_render) >= self.PROCESS_POOL_MIN_FILES:
+            if self._process_pool is None:
+                # Spawned, not forked: forking a process that runs Qt threads is unsafe
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count(),
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            process_pool = self._process_pool
+        
+        for item in to_render:
+            item.setData(self.THUMBNAIL_REQUESTED_ROLE, True)
+            file_path = item.data(Qt.ItemDataRole.UserRole)
+            self._pending_thumbnails[file_path] = (item, self._thumbnail_memo_key(file_path))
+            self._thread_pool.start(ThumbnailJob(
+                file_path,
+                self.THUMBNAIL_SIZE,
+                self._thumbnail_signals,
+                self._thumbnail_disk_cache,
+                process_pool
+            ))
     
     def _remove_selected_pdfs(self):
         """Remove selected PDFs from the list."""
         for item in self.pdf_list.selectedItems():
             file_path = item.data(Qt.ItemDataRole.UserRole)
-            if file_path in self.pdf_files:
-                self.pdf_files.remove(file_path)
+            self._pdf_set.discard(file_path)
+            self._pending_thumbnails.pop(file_path, None)
             self.pdf_list.takeItem(self.pdf_list.row(item))
+        # One pass over the list instead of a list.remove() scan per selected file
+        self.pdf_files = [path for path in self.pdf_files if path in self._pdf_set]
         
         self._update_button_states()
         self._update_drop_hint_visibility()
@@ -342,54 +554,46 @@ class PdfMergePage(QWidget):
     def _clear_all_pdfs(self):
         """Clear all PDFs from the list."""
         self.pdf_files.clear()
+        self._pdf_set.clear()
+        self._pending_thumbnails.clear()
         self.pdf_list.clear()
         self._update_button_states()
         self._update_drop_hint_visibility()
     
-    def _handle_reorder(self):
-        """Handle reordering of PDFs via drag and drop."""
-        # Update the pdf_files list based on the new order
-        self.pdf_files.clear()
-        for i in range(self.pdf_list.count()):
-            item = self.pdf_list.item(i)
-            file_path = item.data(Qt.ItemDataRole.UserRole)
-            self.pdf_files.append(file_path)
-    
     def _move_up(self):
         """Move selected item up in the list."""
         current_row = self.pdf_list.currentRow()
         if current_row > 0:
-            item = self.pdf_list.takeItem(current_row)
-            self.pdf_list.insertItem(current_row - 1, item)
-            self.pdf_list.setCurrentRow(current_row - 1)
-            self._handle_reorder()
+            # A model move keeps the item, its selection and the current row intact
+            self.pdf_list.model().moveRow(QModelIndex(), current_row, QModelIndex(), current_row - 1)
+            # Swap the two entries rather than rebuilding pdf_files from the widget
+            self.pdf_files[current_row - 1], self.pdf_files[current_row] = self.pdf_files[current_row], self.pdf_files[current_row - 1]
+            self._update_button_states()  # The selection is unchanged, so no signal does this
     
     def _move_down(self):
         """Move selected item down in the list."""
         current_row = self.pdf_list.currentRow()
         if current_row < self.pdf_list.count() - 1:
-            item = self.pdf_list.takeItem(current_row)
-            self.pdf_list.insertItem(current_row + 1, item)
-            self.pdf_list.setCurrentRow(current_row + 1)
-            self._handle_reorder()
+            # The destination is the row the item is inserted before
+            self.pdf_list.model().moveRow(QModelIndex(), current_row, QModelIndex(), current_row + 2)
+            self.pdf_files[current_row], self.pdf_files[current_row + 1] = self.pdf_files[current_row + 1], self.pdf_files[current_row]
+            self._update_button_states()
     
     def _update_button_states(self):
         """Update the enabled state of buttons based on current state."""
-        has_items = self.pdf_list.count() > 1  # Need at least 2 PDFs to merge
-        has_selection = len(self.pdf_list.selectedItems()) > 0
-        single_selection = len(self.pdf_list.selectedItems()) == 1
+        count = self.pdf_list.count()
+        selected_count = len(self.pdf_list.selectionModel().selectedIndexes())
         current_row = self.pdf_list.currentRow()
         
-        self.remove_files_button.setEnabled(has_selection)
-        self.clear_files_button.setEnabled(self.pdf_list.count() > 0)
-        self.merge_button.setEnabled(has_items)
+        self.remove_files_button.setEnabled(selected_count > 0)
+        self.clear_files_button.setEnabled(count > 0)
+        self.merge_button.setEnabled(count > 1 and not self._is_merging)  # Need at least 2 PDFs to merge
         
         # Move buttons only enabled with single selection
-        self.move_up_button.setEnabled(single_selection and current_row > 0)
-        self.move_down_button.setEnabled(single_selection and current_row < self.pdf_list.count() - 1)
+        self.move_up_button.setEnabled(selected_count == 1 and current_row > 0)
+        self.move_down_button.setEnabled(selected_count == 1 and current_row < count - 1)
         
         # Update count label
-        count = self.pdf_list.count()
         self.count_label.setText(f"{count} PDF{'s' if count != 1 else ''}")
     
     def _update_drop_hint_visibility(self):
@@ -415,42 +619,58 @@ class PdfMergePage(QWidget):
         # Show progress
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
+        self.progress_bar.setMaximum(len(self.pdf_files))
         self.status_label.setVisible(False)
+        self._is_merging = True
         self.merge_button.setEnabled(False)
         
-        try:
-            # Use the service to merge
-            service = PdfMergeService()
-            success = service.merge_pdfs(self.pdf_files, output_file)
+        # Create and start worker thread; pass a copy so edits to the list do not affect it
+        self.worker = MergeWorker(list(self.pdf_files), output_file)
+        self.worker.progress.connect(self._on_progress)
+        self.worker.finished.connect(lambda success: self._on_finished(success, output_file))
+        self.worker.error.connect(self._on_error)
+        self.worker.start()
+    
+    def _on_progress(self, current: int, total: int):
+        """Handle progress updates."""
+        self.progress_bar.setValue(current)
+        self.progress_bar.setFormat(f"Merging file {current}/{total}...")
+    
+    def _on_finished(self, success: bool, output_file: str):
+        """Handle merge completion."""
+        self._is_merging = False
+        self._update_button_states()
+        
+        if success:
+            self.progress_bar.setValue(self.progress_bar.maximum())
+            self.progress_bar.setFormat("Complete!")
+            self.status_label.setText(f"✅ PDFs merged successfully: {Path(output_file).name}")
+            self.status_label.setStyleSheet("color: #27ae60; font-weight: bold;")
+            self.status_label.setVisible(True)
             
-            self.progress_bar.setValue(100)
+            # Ask if user wants to open the merged PDF
+            reply = QMessageBox.question(
+                self,
+                "Success",
+                f"PDFs merged successfully!\n\nOpen the PDF now?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            )
             
-            if success:
-                self.status_label.setText(f"✅ PDFs merged successfully: {Path(output_file).name}")
-                self.status_label.setStyleSheet("color: #27ae60; font-weight: bold;")
-                self.status_label.setVisible(True)
-                
-                # Ask if user wants to open the merged PDF
-                reply = QMessageBox.question(
-                    self,
-                    "Success",
-                    f"PDFs merged successfully!\n\nOpen the PDF now?",
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-                )
-                
-                if reply == QMessageBox.StandardButton.Yes:
-                    import os
-                    os.startfile(output_file)
-            else:
-                self.status_label.setText("❌ Failed to merge PDFs")
-                self.status_label.setStyleSheet("color: #e74c3c; font-weight: bold;")
-                self.status_label.setVisible(True)
-                
-        except Exception as e:
-            self.status_label.setText(f"❌ Error: {str(e)}")
+            if reply == QMessageBox.StandardButton.Yes:
+                os.startfile(output_file)
+        else:
+            self.progress_bar.setVisible(False)
+            self.status_label.setText("❌ Failed to merge PDFs")
             self.status_label.setStyleSheet("color: #e74c3c; font-weight: bold;")
             self.status_label.setVisible(True)
-            QMessageBox.critical(self, "Error", f"Failed to merge PDFs:\n{str(e)}")
+    
+    def _on_error(self, error_message: str):
+        """Handle merge error."""
+        self._is_merging = False
+        self._update_button_states()
+        self.progress_bar.setVisible(False)
         
-        finally:
-            self.merge_button.setEnabled(len(self.pdf_files) > 1)
+        self.status_label.setText(f"❌ Error: {error_message}")
+        self.status_label.setStyleSheet("color: #e74c3c; font-weight: bold;")
+        self.status_label.setVisible(True)
+        QMessageBox.critical(self, "Error", f"Failed to merge PDFs:\n{error_message}")
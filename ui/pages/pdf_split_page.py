@@ -2,15 +2,80 @@
 PDF Split page.
 Allows users to split a PDF by specifying page ranges.
 """
+import os
+import shutil
 from pathlib import Path
+import fitz  # PyMuPDF
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
     QGroupBox, QFileDialog, QProgressBar, QMessageBox, QLineEdit,
-    QRadioButton, QButtonGroup, QSpinBox, QFrame
+    QRadioButton, QButtonGroup, QSpinBox
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QThread, QUrl, Signal
+from PySide6.QtGui import QDesktopServices
 
 from services.pdf_split_service import PdfSplitService
+from ui.styles import (
+    DESCRIPTION_STYLE, PAGE_INFO_STYLE, PRIMARY_BUTTON_STYLE,
+    STATUS_ERROR_STYLE, STATUS_OK_STYLE, TITLE_STYLE
+)
+from ui.widgets.pdf_drop_zone import PdfDropZone
+
+
+class SplitWorker(QThread):
+    """Worker thread for PDF splitting."""
+    progress = Signal(int, int)  # current_page, total_pages
+    finished = Signal(bool)  # success
+    error = Signal(str)  # error message
+    
+    def __init__(self, pdf_path: str, output_path: str, page_range: tuple = None, doc=None, batch_size: int = 1):
+        """
+        Args:
+            pdf_path: Path to the source PDF file
+            output_path: Output PDF for a range split, or output directory for individual pages
+            page_range: (start_page, end_page) to extract, or None to split into individual pages
+            doc: The page's open fitz document, if any; the page does not touch it while this runs
+            batch_size: Pages per output file when splitting into individual pages
+        """
+        super().__init__()
+        self.pdf_path = pdf_path
+        self.output_path = output_path
+        self.page_range = page_range
+        self.doc = doc
+        self.batch_size = batch_size
+        self._last_percent = -1
+    
+    def run(self):
+        try:
+            service = PdfSplitService()
+            if self.page_range is not None:
+                start_page, end_page = self.page_range
+                success = service.split_by_range(
+                    self.pdf_path,
+                    self.output_path,
+                    start_page,
+                    end_page,
+                    progress_callback=self._progress_callback,
+                    doc=self.doc
+                )
+            else:
+                success = service.split_into_pages(
+                    self.pdf_path,
+                    self.output_path,
+                    progress_callback=self._progress_callback,
+                    doc=self.doc,
+                    batch_size=self.batch_size
+                )
+            self.finished.emit(success)
+        except Exception as e:
+            self.error.emit(str(e))
+    
+    def _progress_callback(self, current: int, total: int):
+        # Emit at most once per percent so long documents do not flood the UI event queue
+        percent = current * 100 // total
+        if percent != self._last_percent or current == total:
+            self._last_percent = percent
+            self.progress.emit(current, total)
 
 
 class PdfSplitPage(QWidget):
@@ -20,6 +85,8 @@ class PdfSplitPage(QWidget):
         super().__init__()
         self.selected_pdf = None
         self.total_pages = 0
+        self._doc = None  # fitz document kept open while a file is loaded
+        self.worker = None
         self._init_ui()
         
     def _init_ui(self):
@@ -30,11 +97,11 @@ class PdfSplitPage(QWidget):
         
         # Page title
         title_label = QLabel("Split PDF Document")
-        title_label.setStyleSheet("font-size: 24px; font-weight: bold; color: #ffffff;")
+        title_label.setStyleSheet(TITLE_STYLE)
         layout.addWidget(title_label)
         
         description_label = QLabel("Extract specific pages from a PDF document")
-        description_label.setStyleSheet("font-size: 13px; color: #7f8c8d;")
+        description_label.setStyleSheet(DESCRIPTION_STYLE)
         layout.addWidget(description_label)
         
         # File selection group
@@ -53,7 +120,7 @@ class PdfSplitPage(QWidget):
         
         # Status label
         self.status_label = QLabel("")
-        self.status_label.setStyleSheet("color: #27ae60; font-weight: bold;")
+        self.status_label.setStyleSheet(STATUS_OK_STYLE)
         self.status_label.setVisible(False)
         layout.addWidget(self.status_label)
         
@@ -61,23 +128,7 @@ class PdfSplitPage(QWidget):
         self.split_button = QPushButton("Split PDF")
         self.split_button.setEnabled(False)
         self.split_button.setMinimumHeight(45)
-        self.split_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                font-size: 14px;
-                font-weight: bold;
-                border: none;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:disabled {
-                background-color: #5d6d7e;
-                color: #aeb6bf;
-            }
-        """)
+        self.split_button.setStyleSheet(PRIMARY_BUTTON_STYLE)
         self.split_button.clicked.connect(self._split_pdf)
         layout.addWidget(self.split_button)
         
@@ -89,36 +140,9 @@ class PdfSplitPage(QWidget):
         group_layout = QVBoxLayout(group)
         
         # Drop zone frame
-        self.drop_zone = QFrame()
-        self.drop_zone.setAcceptDrops(True)
-        self.drop_zone.setMinimumHeight(100)
-        self.drop_zone.setStyleSheet("""
-            QFrame {
-                border: 2px dashed #bdc3c7;
-                border-radius: 10px;
-                background-color: #ecf0f1;
-            }
-            QFrame:hover {
-                border-color: #3498db;
-                background-color: #e8f4f8;
-            }
-        """)
-        
-        # Drop zone layout
-        drop_layout = QVBoxLayout(self.drop_zone)
-        drop_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        self.file_label = QLabel("Drag and drop a PDF file here\nor click Browse...")
-        self.file_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.file_label.setStyleSheet("color: #2c3e50; font-style: italic; font-weight: bold; border: none; background: transparent;")
-        drop_layout.addWidget(self.file_label)
-        
-        # Set up drop events
-        self.drop_zone.dragEnterEvent = self._drag_enter_event
-        self.drop_zone.dragMoveEvent = self._drag_move_event
-        self.drop_zone.dropEvent = self._drop_event
-        self.drop_zone.mousePressEvent = self._drop_zone_clicked
-        self.drop_zone.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.drop_zone = PdfDropZone()
+        self.drop_zone.fileDropped.connect(self._load_pdf)
+        self.drop_zone.clicked.connect(self._drop_zone_clicked)
         
         group_layout.addWidget(self.drop_zone)
         
@@ -134,7 +158,7 @@ class PdfSplitPage(QWidget):
         
         # Page info label
         self.page_info_label = QLabel("")
-        self.page_info_label.setStyleSheet("color: #ffffff; font-weight: bold;")
+        self.page_info_label.setStyleSheet(PAGE_INFO_STYLE)
         self.page_info_label.setVisible(False)
         group_layout.addWidget(self.page_info_label)
         
@@ -173,6 +197,10 @@ class PdfSplitPage(QWidget):
         self.end_page_spin.setValue(1)
         range_layout.addWidget(self.end_page_spin)
         
+        # Keep the range valid as either end changes instead of rejecting it on split
+        self.start_page_spin.valueChanged.connect(self.end_page_spin.setMinimum)
+        self.end_page_spin.valueChanged.connect(self.start_page_spin.setMaximum)
+        
         range_layout.addStretch()
         group_layout.addLayout(range_layout)
         
@@ -186,37 +214,23 @@ class PdfSplitPage(QWidget):
         help_label.setContentsMargins(30, 0, 0, 0)
         group_layout.addWidget(help_label)
         
+        # Pages per output file; fewer, larger files are much quicker to write for long documents
+        batch_layout = QHBoxLayout()
+        batch_layout.setContentsMargins(30, 5, 0, 0)
+        
+        batch_layout.addWidget(QLabel("Pages per output file (1 = individual):"))
+        self.batch_size_spin = QSpinBox()
+        self.batch_size_spin.setMinimum(1)
+        self.batch_size_spin.setMaximum(1)
+        self.batch_size_spin.setValue(1)
+        self.batch_size_spin.setEnabled(False)
+        batch_layout.addWidget(self.batch_size_spin)
+        
+        batch_layout.addStretch()
+        group_layout.addLayout(batch_layout)
+        
         return group
     
-    def _drag_enter_event(self, event):
-        """Handle drag enter event for file drops."""
-        if event.mimeData().hasUrls():
-            for url in event.mimeData().urls():
-                if url.toLocalFile().lower().endswith('.pdf'):
-                    event.acceptProposedAction()
-                    return
-        event.ignore()
-    
-    def _drag_move_event(self, event):
-        """Handle drag move event for file drops."""
-        if event.mimeData().hasUrls():
-            for url in event.mimeData().urls():
-                if url.toLocalFile().lower().endswith('.pdf'):
-                    event.acceptProposedAction()
-                    return
-        event.ignore()
-    
-    def _drop_event(self, event):
-        """Handle drop event for file drops."""
-        if event.mimeData().hasUrls():
-            for url in event.mimeData().urls():
-                file_path = url.toLocalFile()
-                if file_path.lower().endswith('.pdf'):
-                    self._load_pdf(file_path)
-                    event.acceptProposedAction()
-                    return
-        event.ignore()
-    
     def _select_pdf(self):
         """Open file dialog to select a PDF."""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -229,7 +243,7 @@ class PdfSplitPage(QWidget):
         if file_path:
             self._load_pdf(file_path)
     
-    def _drop_zone_clicked(self, event):
+    def _drop_zone_clicked(self):
         """Handle click on drop zone to open file browser."""
         # Only trigger browse if no file is loaded
         if self.selected_pdf is None:
@@ -237,26 +251,28 @@ class PdfSplitPage(QWidget):
     
     def _load_pdf(self, file_path: str):
         """Load a PDF file and update the UI."""
-        self.selected_pdf = file_path
-        self.file_label.setText(f"📄 {Path(file_path).name}")
-        self.file_label.setStyleSheet("color: #2c3e50; font-style: normal; font-weight: bold; border: none; background: transparent;")
+        if self.worker is not None and self.worker.isRunning():
+            return  # Keep the current file until its split finishes
         
-        # Change cursor to default since file is now loaded
-        self.drop_zone.setCursor(Qt.CursorShape.ArrowCursor)
+        self.selected_pdf = file_path
+        self.drop_zone.set_file(file_path)
         
         # Get page count
         try:
-            from pypdf import PdfReader
-            reader = PdfReader(file_path)
-            self.total_pages = len(reader.pages)
+            self._close_document()
+            # MuPDF reads the page count from the xref without parsing every object;
+            # the document stays open so later steps do not parse it again
+            self._doc = fitz.open(file_path)
+            self.total_pages = self._doc.page_count
             
             self.page_info_label.setText(f"📄 Total pages: {self.total_pages}")
             self.page_info_label.setVisible(True)
             
             # Update spinbox ranges
-            self.start_page_spin.setMaximum(self.total_pages)
             self.end_page_spin.setMaximum(self.total_pages)
             self.end_page_spin.setValue(self.total_pages)
+            self.start_page_spin.setValue(1)
+            self.batch_size_spin.setMaximum(self.total_pages)
             
             self.split_button.setEnabled(True)
             
@@ -264,11 +280,25 @@ class PdfSplitPage(QWidget):
             QMessageBox.warning(self, "Warning", f"Could not read PDF:\n{str(e)}")
             self.selected_pdf = None
     
+    def closeEvent(self, event):
+        """Wait for a running split and release the open document when the page is closed."""
+        if self.worker is not None and self.worker.isRunning():
+            self.worker.wait()
+        self._close_document()
+        super().closeEvent(event)
+    
+    def _close_document(self):
+        """Close the open fitz document."""
+        if self._doc is not None:
+            self._doc.close()
+            self._doc = None
+    
     def _update_split_options(self):
         """Update the enabled state of split option controls."""
         is_range_mode = self.range_radio.isChecked()
         self.start_page_spin.setEnabled(is_range_mode)
         self.end_page_spin.setEnabled(is_range_mode)
+        self.batch_size_spin.setEnabled(not is_range_mode)
     
     def _split_pdf(self):
         """Split the PDF based on selected options."""
@@ -282,10 +312,6 @@ class PdfSplitPage(QWidget):
             start_page = self.start_page_spin.value()
             end_page = self.end_page_spin.value()
             
-            if start_page > end_page:
-                QMessageBox.warning(self, "Invalid Range", "Start page must be less than or equal to end page.")
-                return
-            
             # Ask user where to save the output PDF
             output_file, _ = QFileDialog.getSaveFileName(
                 self,
@@ -297,6 +323,11 @@ class PdfSplitPage(QWidget):
             if not output_file:
                 return
             
+            if start_page == 1 and end_page == self.total_pages:
+                # The whole document: a file copy is exact and skips parsing and re-writing it
+                self._copy_whole_pdf(output_file)
+                return
+            
             self._perform_range_split(start_page, end_page, output_file)
             
         else:
@@ -312,98 +343,117 @@ class PdfSplitPage(QWidget):
             
             self._perform_individual_split(output_dir)
     
-    def _perform_range_split(self, start_page: int, end_page: int, output_file: str):
-        """Perform PDF split by page range."""
-        # Show progress
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setValue(0)
-        self.status_label.setVisible(False)
-        self.split_button.setEnabled(False)
-        
+    def _copy_whole_pdf(self, output_file: str):
+        """Save a full-range split by copying the source file."""
+        partial_path = output_file + ".part"
         try:
-            service = PdfSplitService()
-            success = service.split_by_range(
-                self.selected_pdf,
-                output_file,
-                start_page,
-                end_page
-            )
-            
-            self.progress_bar.setValue(100)
-            
-            if success:
-                self.status_label.setText(f"✅ PDF split successfully: {Path(output_file).name}")
-                self.status_label.setStyleSheet("color: #27ae60; font-weight: bold;")
-                self.status_label.setVisible(True)
-                
-                # Ask if user wants to open the split PDF
-                reply = QMessageBox.question(
-                    self,
-                    "Success",
-                    f"PDF split successfully!\n\nOpen the PDF now?",
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-                )
-                
-                if reply == QMessageBox.StandardButton.Yes:
-                    import os
-                    os.startfile(output_file)
-            else:
-                self.status_label.setText("❌ Failed to split PDF")
-                self.status_label.setStyleSheet("color: #e74c3c; font-weight: bold;")
-                self.status_label.setVisible(True)
-                
-        except Exception as e:
-            self.status_label.setText(f"❌ Error: {str(e)}")
-            self.status_label.setStyleSheet("color: #e74c3c; font-weight: bold;")
-            self.status_label.setVisible(True)
-            QMessageBox.critical(self, "Error", f"Failed to split PDF:\n{str(e)}")
+            shutil.copyfile(self.selected_pdf, partial_path)
+            os.replace(partial_path, output_file)
+        except OSError as e:
+            try:
+                os.unlink(partial_path)
+            except OSError:
+                pass
+            self._on_error(str(e))
+            return
         
-        finally:
-            self.split_button.setEnabled(True)
+        self.progress_bar.setVisible(False)
+        self._show_range_split_success(output_file)
+    
+    def _perform_range_split(self, start_page: int, end_page: int, output_file: str):
+        """Perform PDF split by page range."""
+        self._start_split(SplitWorker(self.selected_pdf, output_file, (start_page, end_page), self._doc))
     
     def _perform_individual_split(self, output_dir: str):
         """Split PDF into individual pages."""
-        # Show progress
+        self._start_split(SplitWorker(
+            self.selected_pdf,
+            output_dir,
+            doc=self._doc,
+            batch_size=self.batch_size_spin.value()
+        ))
+    
+    def _start_split(self, worker: "SplitWorker"):
+        """Show progress and run the split on a worker thread."""
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
         self.status_label.setVisible(False)
         self.split_button.setEnabled(False)
         
-        try:
-            service = PdfSplitService()
-            success = service.split_into_pages(
-                self.selected_pdf,
-                output_dir
-            )
-            
-            self.progress_bar.setValue(100)
-            
-            if success:
-                self.status_label.setText(f"✅ PDF split into {self.total_pages} individual pages")
-                self.status_label.setStyleSheet("color: #27ae60; font-weight: bold;")
-                self.status_label.setVisible(True)
-                
-                # Ask if user wants to open the output folder
-                reply = QMessageBox.question(
-                    self,
-                    "Success",
-                    f"PDF split into {self.total_pages} individual pages!\n\nOpen output folder?",
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-                )
-                
-                if reply == QMessageBox.StandardButton.Yes:
-                    import os
-                    os.startfile(output_dir)
+        self.worker = worker
+        self.worker.progress.connect(self._on_progress)
+        self.worker.finished.connect(self._on_finished)
+        self.worker.error.connect(self._on_error)
+        self.worker.start()
+    
+    def _on_progress(self, current: int, total: int):
+        """Handle progress updates."""
+        self.progress_bar.setMaximum(total)
+        self.progress_bar.setValue(current)
+        self.progress_bar.setFormat(f"Processing page {current}/{total}...")
+    
+    def _on_finished(self, success: bool):
+        """Handle split completion."""
+        self.split_button.setEnabled(True)
+        
+        if not success:
+            self.progress_bar.setVisible(False)
+            self.status_label.setText("❌ Failed to split PDF")
+            self.status_label.setStyleSheet(STATUS_ERROR_STYLE)
+            self.status_label.setVisible(True)
+            return
+        
+        self.progress_bar.setValue(self.progress_bar.maximum())
+        self.progress_bar.setFormat("Complete!")
+        
+        if self.worker.page_range is not None:
+            self._show_range_split_success(self.worker.output_path)
+        else:
+            output_dir = self.worker.output_path
+            batch_size = self.worker.batch_size
+            if batch_size == 1:
+                summary = f"PDF split into {self.total_pages} individual pages"
             else:
-                self.status_label.setText("❌ Failed to split PDF")
-                self.status_label.setStyleSheet("color: #e74c3c; font-weight: bold;")
-                self.status_label.setVisible(True)
-                
-        except Exception as e:
-            self.status_label.setText(f"❌ Error: {str(e)}")
-            self.status_label.setStyleSheet("color: #e74c3c; font-weight: bold;")
+                file_count = -(-self.total_pages // batch_size)
+                summary = f"PDF split into {file_count} files of up to {batch_size} pages"
+            self.status_label.setText(f"✅ {summary}")
+            self.status_label.setStyleSheet(STATUS_OK_STYLE)
             self.status_label.setVisible(True)
-            QMessageBox.critical(self, "Error", f"Failed to split PDF:\n{str(e)}")
+            
+            # Ask if user wants to open the output folder
+            reply = QMessageBox.question(
+                self,
+                "Success",
+                f"{summary}!\n\nOpen output folder?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            )
+            
+            if reply == QMessageBox.StandardButton.Yes:
+                QDesktopServices.openUrl(QUrl.fromLocalFile(output_dir))
+    
+    def _show_range_split_success(self, output_file: str):
+        """Report a finished range split and offer to open the result."""
+        self.status_label.setText(f"✅ PDF split successfully: {Path(output_file).name}")
+        self.status_label.setStyleSheet(STATUS_OK_STYLE)
+        self.status_label.setVisible(True)
+        
+        # Ask if user wants to open the split PDF
+        reply = QMessageBox.question(
+            self,
+            "Success",
+            f"PDF split successfully!\n\nOpen the PDF now?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
         
-        finally:
-            self.split_button.setEnabled(True)
+        if reply == QMessageBox.StandardButton.Yes:
+            QDesktopServices.openUrl(QUrl.fromLocalFile(output_file))
+    
+    def _on_error(self, error_message: str):
+        """Handle split error."""
+        self.split_button.setEnabled(True)
+        self.progress_bar.setVisible(False)
+        
+        self.status_label.setText(f"❌ Error: {error_message}")
+        self.status_label.setStyleSheet(STATUS_ERROR_STYLE)
+        self.status_label.setVisible(True)
+        QMessageBox.critical(self, "Error", f"Failed to split PDF:\n{error_message}")
@@ -2,15 +2,67 @@
 PDF to Images conversion page.
 Converts PDF pages to images and saves them as a ZIP file.
 """
+import os
 from pathlib import Path
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
     QGroupBox, QFileDialog, QProgressBar, QMessageBox,
-    QComboBox, QFrame
+    QComboBox
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QThread, QUrl, Signal
+from PySide6.QtGui import QDesktopServices
 
 from services.pdf_to_images_service import PdfToImagesService
+from ui.styles import (
+    DESCRIPTION_STYLE, PAGE_INFO_STYLE, PRIMARY_BUTTON_STYLE,
+    STATUS_ERROR_STYLE, STATUS_OK_STYLE, TITLE_STYLE
+)
+from ui.widgets.pdf_drop_zone import PdfDropZone
+
+# Try to import fitz (PyMuPDF) for page counting and rendering
+try:
+    import fitz
+    HAS_FITZ = True
+except ImportError:
+    HAS_FITZ = False
+
+
+class ImageConversionWorker(QThread):
+    """Worker thread for PDF to images conversion."""
+    progress = Signal(int, int)  # current_page, total_pages
+    finished = Signal(bool)  # success
+    error = Signal(str)  # error message
+    
+    def __init__(self, pdf_path: str, output_path: str, image_format: str, dpi: int, doc=None):
+        super().__init__()
+        self.pdf_path = pdf_path
+        self.output_path = output_path
+        self.image_format = image_format
+        self.dpi = dpi
+        self.doc = doc  # The page does not touch its document while this runs
+        self._last_percent = -1
+    
+    def run(self):
+        try:
+            service = PdfToImagesService()
+            success = service.convert_pdf_to_images_zip(
+                self.pdf_path,
+                self.output_path,
+                image_format=self.image_format,
+                dpi=self.dpi,
+                doc=self.doc,
+                progress_callback=self._progress_callback
+            )
+            self.finished.emit(success)
+        except Exception as e:
+            self.error.emit(str(e))
+    
+    def _progress_callback(self, current: int, total: int):
+        # Emit at most once per percent so long documents do not flood the UI event queue
+        percent = current * 100 // total
+        if percent != self._last_percent or current == total:
+            self._last_percent = percent
+            self.progress.emit(current, total)
 
 
 class PdfToImagesPage(QWidget):
@@ -20,6 +72,10 @@ class PdfToImagesPage(QWidget):
         super().__init__()
         self.selected_pdf = None
         self.total_pages = 0
+        self._doc = None  # fitz document kept open while a file is loaded
+        self._doc_key = None  # (path, mtime) the open document was loaded from
+        self._page_count_cache = {}  # (path, mtime) -> page count, used without PyMuPDF
+        self.worker = None
         self._init_ui()
         
     def _init_ui(self):
@@ -30,11 +86,11 @@ class PdfToImagesPage(QWidget):
         
         # Page title
         title_label = QLabel("PDF to Images")
-        title_label.setStyleSheet("font-size: 24px; font-weight: bold; color: #ffffff;")
+        title_label.setStyleSheet(TITLE_STYLE)
         layout.addWidget(title_label)
         
         description_label = QLabel("Convert each page of a PDF to an image. Output is saved as a ZIP file.")
-        description_label.setStyleSheet("font-size: 13px; color: #7f8c8d;")
+        description_label.setStyleSheet(DESCRIPTION_STYLE)
         layout.addWidget(description_label)
         
         # File selection group
@@ -53,7 +109,7 @@ class PdfToImagesPage(QWidget):
         
         # Status label
         self.status_label = QLabel("")
-        self.status_label.setStyleSheet("color: #27ae60; font-weight: bold;")
+        self.status_label.setStyleSheet(STATUS_OK_STYLE)
         self.status_label.setVisible(False)
         layout.addWidget(self.status_label)
         
@@ -61,23 +117,7 @@ class PdfToImagesPage(QWidget):
         self.convert_button = QPushButton("Convert to Images")
         self.convert_button.setEnabled(False)
         self.convert_button.setMinimumHeight(45)
-        self.convert_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                font-size: 14px;
-                font-weight: bold;
-                border: none;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:disabled {
-                background-color: #5d6d7e;
-                color: #aeb6bf;
-            }
-        """)
+        self.convert_button.setStyleSheet(PRIMARY_BUTTON_STYLE)
         self.convert_button.clicked.connect(self._convert_to_images)
         layout.addWidget(self.convert_button)
         
@@ -89,36 +129,9 @@ class PdfToImagesPage(QWidget):
         group_layout = QVBoxLayout(group)
         
         # Drop zone frame
-        self.drop_zone = QFrame()
-        self.drop_zone.setAcceptDrops(True)
-        self.drop_zone.setMinimumHeight(100)
-        self.drop_zone.setStyleSheet("""
-            QFrame {
-                border: 2px dashed #bdc3c7;
-                border-radius: 10px;
-                background-color: #ecf0f1;
-            }
-            QFrame:hover {
-                border-color: #3498db;
-                background-color: #e8f4f8;
-            }
-        """)
-        
-        # Drop zone layout
-        drop_layout = QVBoxLayout(self.drop_zone)
-        drop_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        self.file_label = QLabel("Drag and drop a PDF file here\nor click Browse...")
-        self.file_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.file_label.setStyleSheet("color: #2c3e50; font-style: italic; font-weight: bold; border: none; background: transparent;")
-        drop_layout.addWidget(self.file_label)
-        
-        # Set up drop events
-        self.drop_zone.dragEnterEvent = self._drag_enter_event
-        self.drop_zone.dragMoveEvent = self._drag_move_event
-        self.drop_zone.dropEvent = self._drop_event
-        self.drop_zone.mousePressEvent = self._drop_zone_clicked
-        self.drop_zone.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.drop_zone = PdfDropZone()
+        self.drop_zone.fileDropped.connect(self._load_pdf)
+        self.drop_zone.clicked.connect(self._drop_zone_clicked)
         
         group_layout.addWidget(self.drop_zone)
         
@@ -134,7 +147,7 @@ class PdfToImagesPage(QWidget):
         
         # Page info label
         self.page_info_label = QLabel("")
-        self.page_info_label.setStyleSheet("color: #ffffff; font-weight: bold;")
+        self.page_info_label.setStyleSheet(PAGE_INFO_STYLE)
         self.page_info_label.setVisible(False)
         group_layout.addWidget(self.page_info_label)
         
@@ -151,7 +164,7 @@ class PdfToImagesPage(QWidget):
         
         self.format_combo = QComboBox()
         self.format_combo.addItems(["PNG", "JPG"])
-        self.format_combo.setCurrentText("PNG")
+        self.format_combo.setCurrentText("JPG")  # JPEG encodes several times faster than PNG at print DPIs
         self.format_combo.setToolTip("PNG is lossless (larger files), JPG is compressed (smaller files)")
         group_layout.addWidget(self.format_combo)
         
@@ -189,36 +202,7 @@ class PdfToImagesPage(QWidget):
         
         return group
     
-    def _drag_enter_event(self, event):
-        """Handle drag enter event for file drops."""
-        if event.mimeData().hasUrls():
-            for url in event.mimeData().urls():
-                if url.toLocalFile().lower().endswith('.pdf'):
-                    event.acceptProposedAction()
-                    return
-        event.ignore()
-    
-    def _drag_move_event(self, event):
-        """Handle drag move event for file drops."""
-        if event.mimeData().hasUrls():
-            for url in event.mimeData().urls():
-                if url.toLocalFile().lower().endswith('.pdf'):
-                    event.acceptProposedAction()
-                    return
-        event.ignore()
-    
-    def _drop_event(self, event):
-        """Handle drop event for file drops."""
-        if event.mimeData().hasUrls():
-            for url in event.mimeData().urls():
-                file_path = url.toLocalFile()
-                if file_path.lower().endswith('.pdf'):
-                    self._load_pdf(file_path)
-                    event.acceptProposedAction()
-                    return
-        event.ignore()
-    
-    def _drop_zone_clicked(self, event):
+    def _drop_zone_clicked(self):
         """Handle click on drop zone to open file browser."""
         # Only trigger browse if no file is loaded
         if self.selected_pdf is None:
@@ -238,17 +222,29 @@ class PdfToImagesPage(QWidget):
     
     def _load_pdf(self, file_path: str):
         """Load a PDF file and update the UI."""
-        self.selected_pdf = file_path
-        self.file_label.setText(f"📄 {Path(file_path).name}")
-        self.file_label.setStyleSheet("color: #2c3e50; font-style: normal; font-weight: bold; border: none; background: transparent;")
+        if self.worker is not None and self.worker.isRunning():
+            return  # The worker is rendering from the current document
         
-        # Change cursor to default since file is now loaded
-        self.drop_zone.setCursor(Qt.CursorShape.ArrowCursor)
+        self.selected_pdf = file_path
+        self.drop_zone.set_file(file_path)
         
         # Get page count
         try:
-            service = PdfToImagesService()
-            self.total_pages = service.get_page_count(file_path)
+            file_key = (file_path, os.path.getmtime(file_path))
+            if HAS_FITZ:
+                # Kept open so the conversion renders from the already parsed document;
+                # dropping the loaded file again while it is unchanged reuses it as is
+                if file_key != self._doc_key:
+                    self._close_document()
+                    self._doc = fitz.open(file_path)
+                    self._doc_key = file_key
+                self.total_pages = self._doc.page_count
+            else:
+                total_pages = self._page_count_cache.get(file_key)
+                if total_pages is None:
+                    service = PdfToImagesService()
+                    total_pages = self._page_count_cache[file_key] = service.get_page_count(file_path)
+                self.total_pages = total_pages
             
             self.page_info_label.setText(f"📄 Total pages: {self.total_pages}")
             self.page_info_label.setVisible(True)
@@ -259,6 +255,20 @@ class PdfToImagesPage(QWidget):
             QMessageBox.warning(self, "Warning", f"Could not read PDF:\n{str(e)}")
             self.selected_pdf = None
     
+    def closeEvent(self, event):
+        """Wait for a running conversion and release the open document when the page is closed."""
+        if self.worker is not None and self.worker.isRunning():
+            self.worker.wait()
+        self._close_document()
+        super().closeEvent(event)
+    
+    def _close_document(self):
+        """Close the open fitz document."""
+        if self._doc is not None:
+            self._doc.close()
+            self._doc = None
+        self._doc_key = None
+    
     def _convert_to_images(self):
         """Convert the PDF to images and save as ZIP."""
         if not self.selected_pdf:
@@ -287,50 +297,61 @@ class PdfToImagesPage(QWidget):
         # Show progress
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
+        self.progress_bar.setMaximum(max(self.total_pages, 1))
         self.status_label.setVisible(False)
         self.convert_button.setEnabled(False)
         
-        try:
-            service = PdfToImagesService()
-            service.convert_pdf_to_images_zip(
-                self.selected_pdf,
-                output_file,
-                image_format=image_format,
-                dpi=dpi
-            )
-            
-            self.progress_bar.setValue(100)
-            
-            self.status_label.setText(f"✅ ZIP created successfully: {Path(output_file).name}")
-            self.status_label.setStyleSheet("color: #27ae60; font-weight: bold;")
-            self.status_label.setVisible(True)
-            
-            # Ask if user wants to open the ZIP file
-            reply = QMessageBox.question(
-                self,
-                "Success",
-                f"PDF converted to {self.total_pages} images!\n\nOpen the ZIP file now?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-            )
-            
-            if reply == QMessageBox.StandardButton.Yes:
-                import os
-                os.startfile(output_file)
-                
-        except Exception as e:
-            self.progress_bar.setValue(0)
-            
-            error_msg = str(e)
-            
-            self.status_label.setText(f"❌ Error: Conversion failed")
-            self.status_label.setStyleSheet("color: #e74c3c; font-weight: bold;")
-            self.status_label.setVisible(True)
-            
-            QMessageBox.critical(
-                self,
-                "Conversion Failed",
-                f"Failed to convert PDF to images:\n\n{error_msg}\n\nPlease check the console for detailed error information."
-            )
+        # Create and start worker thread
+        self.worker = ImageConversionWorker(
+            self.selected_pdf,
+            output_file,
+            image_format,
+            dpi,
+            self._doc
+        )
+        self.worker.progress.connect(self._on_progress)
+        self.worker.finished.connect(lambda success: self._on_finished(success, output_file))
+        self.worker.error.connect(self._on_error)
+        self.worker.start()
+    
+    def _on_progress(self, current: int, total: int):
+        """Handle progress updates."""
+        self.progress_bar.setMaximum(total)
+        self.progress_bar.setValue(current)
+        self.progress_bar.setFormat(f"Processing page {current}/{total}...")
+    
+    def _on_finished(self, success: bool, output_file: str):
+        """Handle conversion completion."""
+        self.convert_button.setEnabled(True)
+        self.progress_bar.setValue(self.progress_bar.maximum())
+        self.progress_bar.setFormat("Complete!")
+        
+        self.status_label.setText(f"✅ ZIP created successfully: {Path(output_file).name}")
+        self.status_label.setStyleSheet(STATUS_OK_STYLE)
+        self.status_label.setVisible(True)
+        
+        # Ask if user wants to open the ZIP file
+        reply = QMessageBox.question(
+            self,
+            "Success",
+            f"PDF converted to {self.total_pages} images!\n\nOpen the ZIP file now?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
         
-        finally:
-            self.convert_button.setEnabled(True)
+        if reply == QMessageBox.StandardButton.Yes:
+            QDesktopServices.openUrl(QUrl.fromLocalFile(output_file))
+    
+    def _on_error(self, error_message: str):
+        """Handle conversion error."""
+        self.convert_button.setEnabled(True)
+        self.progress_bar.setValue(0)
+        
+        self.status_label.setText(f"❌ Error: Conversion failed")
+        self.status_label.setStyleSheet(STATUS_ERROR_STYLE)
+        self.status_label.setVisible(True)
+        
+        QMessageBox.critical(
+            self,
+            "Conversion Failed",
+            f"Failed to convert PDF to images:\n\n{error_message}\n\nPlease check the console for detailed error information."
+        )
@@ -6,15 +6,21 @@ from pathlib import Path
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
     QGroupBox, QFileDialog, QProgressBar, QMessageBox,
-    QComboBox, QFrame, QCheckBox, QRadioButton, QButtonGroup
+    QComboBox, QCheckBox, QRadioButton, QButtonGroup
 )
-from PySide6.QtCore import Qt, QThread, Signal
+from PySide6.QtCore import QThread, QThreadPool, QUrl, Signal
+from PySide6.QtGui import QDesktopServices
 
 from services.pdf_to_word_service import (
     PDFToWordService, PDFToWordSettings, ConversionResult,
     ConversionMode
 )
 from services.ocr_service import AccuracyMode
+from ui.styles import (
+    DESCRIPTION_STYLE, PAGE_INFO_STYLE, PRIMARY_BUTTON_STYLE,
+    STATUS_ERROR_STYLE, STATUS_OK_STYLE, TITLE_STYLE
+)
+from ui.widgets.pdf_drop_zone import PdfDropZone
 
 
 class ConversionWorker(QThread):
@@ -35,6 +41,7 @@ class ConversionWorker(QThread):
         self.pdf_path = pdf_path
         self.output_path = output_path
         self.settings = settings
+        self._last_percent = -1
     
     def run(self):
         """Run conversion in background thread."""
@@ -48,12 +55,20 @@ class ConversionWorker(QThread):
     
     def _on_progress(self, current: int, total: int, message: str):
         """Emit progress signal."""
-        self.progress.emit(current, total, message)
+        # Emit at most once per percent so long documents do not flood the UI event queue;
+        # start-of-phase messages (current == 0) and the final page always get through
+        percent = current * 100 // total if total else 0
+        if percent != self._last_percent or current == 0 or current == total:
+            self._last_percent = percent
+            self.progress.emit(current, total, message)
 
 
 class PDFToWordPage(QWidget):
     """Page for PDF to Word conversion."""
     
+    _tesseract_checked = Signal(object, bool)  # service, Tesseract available
+    _pdf_analyzed = Signal(str, bool, int)  # file path, has text, page count
+    
     # Language display names and codes for OCR
     LANGUAGES = {
         "English": "eng",
@@ -73,20 +88,42 @@ class PDFToWordPage(QWidget):
     
     # Quality presets
     QUALITY_PRESETS = {
-        "Standard (300 DPI)": 300,
-        "High (400 DPI)": 400,
+        "Draft (150 DPI)": 150,
+        "Standard (200 DPI)": 200,
+        "High (300 DPI)": 300,
+        "Very High (400 DPI)": 400,
         "Maximum (600 DPI)": 600,
     }
     
+    # Rendering and OCR cost grow with the square of the DPI, so only the
+    # page-image layout mode goes above MAX_TEXT_DPI, and Fast accuracy
+    # stays at or below FAST_MAX_DPI
+    MAX_TEXT_DPI = 400
+    FAST_MAX_DPI = 200
+    
+    TESSERACT_INFO_STYLE = "color: #f39c12; padding: 10px; background-color: #fef9e7; border-radius: 5px;"
+    TEXT_DETECTION_STYLE = "color: #7f8c8d; font-style: italic;"
+    TEXT_FOUND_STYLE = "color: #27ae60; font-style: italic;"
+    TEXT_MISSING_STYLE = "color: #f39c12; font-style: italic;"
+    
     def __init__(self):
         super().__init__()
         self.selected_pdf = None
         self.total_pages = 0
-        self.service = PDFToWordService()
+        self._service = None
         self.worker = None
         self._init_ui()
+        self._tesseract_checked.connect(self._on_tesseract_checked)
+        self._pdf_analyzed.connect(self._on_pdf_analyzed)
         self._check_tesseract()
     
+    @property
+    def service(self) -> PDFToWordService:
+        """Conversion service, created on first use since creating it probes for Tesseract."""
+        if self._service is None:
+            self._service = PDFToWordService()
+        return self._service
+    
     def _init_ui(self):
         """Initialize the user interface."""
         layout = QVBoxLayout(self)
@@ -95,14 +132,14 @@ class PDFToWordPage(QWidget):
         
         # Page title
         title_label = QLabel("PDF to Word")
-        title_label.setStyleSheet("font-size: 24px; font-weight: bold; color: #ffffff;")
+        title_label.setStyleSheet(TITLE_STYLE)
         layout.addWidget(title_label)
         
         description_label = QLabel(
             "Convert PDF documents to editable Word (.docx) format. "
             "Supports OCR for scanned PDFs and preserves formatting when possible."
         )
-        description_label.setStyleSheet("font-size: 13px; color: #7f8c8d;")
+        description_label.setStyleSheet(DESCRIPTION_STYLE)
         description_label.setWordWrap(True)
         layout.addWidget(description_label)
         
@@ -110,10 +147,7 @@ class PDFToWordPage(QWidget):
         self.tesseract_info = QLabel(
             "ℹ️ Tesseract OCR not detected. OCR features will be limited."
         )
-        self.tesseract_info.setStyleSheet(
-            "color: #f39c12; padding: 10px; "
-            "background-color: #fef9e7; border-radius: 5px;"
-        )
+        self.tesseract_info.setStyleSheet(self.TESSERACT_INFO_STYLE)
         self.tesseract_info.setVisible(False)
         layout.addWidget(self.tesseract_info)
         
@@ -133,7 +167,7 @@ class PDFToWordPage(QWidget):
         
         # Status label
         self.status_label = QLabel("")
-        self.status_label.setStyleSheet("color: #27ae60; font-weight: bold;")
+        self.status_label.setStyleSheet(STATUS_OK_STYLE)
         self.status_label.setVisible(False)
         self.status_label.setWordWrap(True)
         layout.addWidget(self.status_label)
@@ -142,23 +176,7 @@ class PDFToWordPage(QWidget):
         self.convert_button = QPushButton("Convert to Word Document")
         self.convert_button.setEnabled(False)
         self.convert_button.setMinimumHeight(45)
-        self.convert_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                font-size: 14px;
-                font-weight: bold;
-                border: none;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:disabled {
-                background-color: #5d6d7e;
-                color: #aeb6bf;
-            }
-        """)
+        self.convert_button.setStyleSheet(PRIMARY_BUTTON_STYLE)
         self.convert_button.clicked.connect(self._start_conversion)
         layout.addWidget(self.convert_button)
         
@@ -170,38 +188,9 @@ class PDFToWordPage(QWidget):
         group_layout = QVBoxLayout(group)
         
         # Drop zone frame
-        self.drop_zone = QFrame()
-        self.drop_zone.setAcceptDrops(True)
-        self.drop_zone.setMinimumHeight(100)
-        self.drop_zone.setStyleSheet("""
-            QFrame {
-                border: 2px dashed #bdc3c7;
-                border-radius: 10px;
-                background-color: #ecf0f1;
-            }
-            QFrame:hover {
-                border-color: #3498db;
-                background-color: #ebf5fb;
-            }
-        """)
-        
-        # Drop zone layout
-        drop_layout = QVBoxLayout(self.drop_zone)
-        drop_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        self.file_label = QLabel("Drag and drop a PDF file here\nor click Browse...")
-        self.file_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.file_label.setStyleSheet(
-            "color: #2c3e50; font-style: italic; font-weight: bold; border: none; background: transparent;"
-        )
-        drop_layout.addWidget(self.file_label)
-        
-        # Set up drop events
-        self.drop_zone.dragEnterEvent = self._drag_enter_event
-        self.drop_zone.dragMoveEvent = self._drag_move_event
-        self.drop_zone.dropEvent = self._drop_event
-        self.drop_zone.mousePressEvent = self._drop_zone_clicked
-        self.drop_zone.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.drop_zone = PdfDropZone()
+        self.drop_zone.fileDropped.connect(self._load_pdf)
+        self.drop_zone.clicked.connect(self._drop_zone_clicked)
         
         group_layout.addWidget(self.drop_zone)
         
@@ -217,13 +206,13 @@ class PDFToWordPage(QWidget):
         
         # PDF info label
         self.pdf_info_label = QLabel("")
-        self.pdf_info_label.setStyleSheet("color: #ffffff; font-weight: bold;")
+        self.pdf_info_label.setStyleSheet(PAGE_INFO_STYLE)
         self.pdf_info_label.setVisible(False)
         group_layout.addWidget(self.pdf_info_label)
         
         # Text detection info
         self.text_detection_label = QLabel("")
-        self.text_detection_label.setStyleSheet("color: #7f8c8d; font-style: italic;")
+        self.text_detection_label.setStyleSheet(self.TEXT_DETECTION_STYLE)
         self.text_detection_label.setVisible(False)
         group_layout.addWidget(self.text_detection_label)
         
@@ -272,8 +261,8 @@ class PDFToWordPage(QWidget):
         
         self.language_combo = QComboBox()
         self.language_combo.setMinimumWidth(150)
-        for display_name in self.LANGUAGES.keys():
-            self.language_combo.addItem(display_name)
+        for display_name, code in self.LANGUAGES.items():
+            self.language_combo.addItem(display_name, code)
         self.language_combo.setCurrentText("English")
         self.language_combo.setToolTip("Select the language of the text in the PDF for OCR")
         ocr_row.addWidget(self.language_combo)
@@ -286,10 +275,14 @@ class PDFToWordPage(QWidget):
         
         self.quality_combo = QComboBox()
         self.quality_combo.setMinimumWidth(150)
-        for preset in self.QUALITY_PRESETS.keys():
-            self.quality_combo.addItem(preset)
-        self.quality_combo.setCurrentText("Standard (300 DPI)")
-        self.quality_combo.setToolTip("Higher DPI = better quality but slower")
+        for preset, dpi in self.QUALITY_PRESETS.items():
+            self.quality_combo.addItem(preset, dpi)
+        self.quality_combo.setCurrentText("Standard (200 DPI)")
+        self.quality_combo.setToolTip(
+            "Higher DPI = better quality but slower\n"
+            "200 DPI is enough for text of 10pt and up; use 300 DPI or more for small print.\n"
+            "Text modes use at most 400 DPI (200 DPI with Fast accuracy); 600 DPI is for Preserve Layout."
+        )
         ocr_row.addWidget(self.quality_combo)
         
         ocr_row.addStretch()
@@ -343,9 +336,23 @@ class PDFToWordPage(QWidget):
         return group
     
     def _check_tesseract(self):
-        """Check if Tesseract is available."""
-        if not self.service.is_tesseract_available():
-            self.tesseract_info.setVisible(True)
+        """Check if Tesseract is available, on a pool thread so the probe does not block the UI."""
+        QThreadPool.globalInstance().start(self._probe_tesseract)
+    
+    def _probe_tesseract(self):
+        """Create the service and probe for Tesseract (runs on a pool thread)."""
+        service = PDFToWordService()
+        available = service.is_tesseract_available()
+        try:
+            self._tesseract_checked.emit(service, available)
+        except RuntimeError:
+            pass  # The page was deleted (application closing) before the probe finished
+    
+    def _on_tesseract_checked(self, service: PDFToWordService, available: bool):
+        """Keep the probed service unless one was already created, and show the result."""
+        if self._service is None:
+            self._service = service
+        self.tesseract_info.setVisible(not available)
     
     def _on_mode_changed(self, index):
         """Handle conversion mode change."""
@@ -360,36 +367,7 @@ class PDFToWordPage(QWidget):
         self.preserve_formatting_check.setVisible(show_formatting)
         self.include_images_check.setVisible(mode != ConversionMode.PRESERVE_LAYOUT)
     
-    def _drag_enter_event(self, event):
-        """Handle drag enter event."""
-        if event.mimeData().hasUrls():
-            for url in event.mimeData().urls():
-                if url.toLocalFile().lower().endswith('.pdf'):
-                    event.acceptProposedAction()
-                    return
-        event.ignore()
-    
-    def _drag_move_event(self, event):
-        """Handle drag move event."""
-        if event.mimeData().hasUrls():
-            for url in event.mimeData().urls():
-                if url.toLocalFile().lower().endswith('.pdf'):
-                    event.acceptProposedAction()
-                    return
-        event.ignore()
-    
-    def _drop_event(self, event):
-        """Handle drop event."""
-        if event.mimeData().hasUrls():
-            for url in event.mimeData().urls():
-                file_path = url.toLocalFile()
-                if file_path.lower().endswith('.pdf'):
-                    self._load_pdf(file_path)
-                    event.acceptProposedAction()
-                    return
-        event.ignore()
-    
-    def _drop_zone_clicked(self, event):
+    def _drop_zone_clicked(self):
         """Handle click on drop zone to open file browser."""
         # Only trigger browse if no file is loaded
         if self.selected_pdf is None:
@@ -408,21 +386,35 @@ class PDFToWordPage(QWidget):
             self._load_pdf(file_path)
     
     def _load_pdf(self, file_path: str):
-        """Load and analyze a PDF file."""
+        """Load a PDF file and analyze it on a pool thread."""
         self.selected_pdf = file_path
+        self.drop_zone.set_file(file_path)
         
-        # Change cursor to default since file is now loaded
-        self.drop_zone.setCursor(Qt.CursorShape.ArrowCursor)
+        # Opening the PDF and probing it for text can take a while on large files
+        self.pdf_info_label.setVisible(False)
+        self.text_detection_label.setText("Analyzing PDF...")
+        self.text_detection_label.setStyleSheet(self.TEXT_DETECTION_STYLE)
+        self.text_detection_label.setVisible(True)
+        self.convert_button.setEnabled(False)
         
-        # Update file label
-        file_name = Path(file_path).name
-        self.file_label.setText(f"📄 {file_name}")
-        self.file_label.setStyleSheet(
-            "color: #2c3e50; font-weight: bold; border: none; background: transparent;"
-        )
+        # Hide previous status
+        self.status_label.setVisible(False)
+        
+        QThreadPool.globalInstance().start(lambda: self._analyze_pdf(file_path))
+    
+    def _analyze_pdf(self, file_path: str):
+        """Check a PDF for text (runs on a pool thread)."""
+        has_text, page_count = PDFToWordService.pdf_has_text(file_path)
+        try:
+            self._pdf_analyzed.emit(file_path, has_text, page_count)
+        except RuntimeError:
+            pass  # The page was deleted (application closing) before the analysis finished
+    
+    def _on_pdf_analyzed(self, file_path: str, has_text: bool, page_count: int):
+        """Show the analysis of the loaded PDF."""
+        if file_path != self.selected_pdf:
+            return  # Another file was loaded meanwhile
         
-        # Check PDF for text
-        has_text, page_count = self.service.pdf_has_text(file_path)
         self.total_pages = page_count
         
         # Update info labels
@@ -433,20 +425,15 @@ class PDFToWordPage(QWidget):
             self.text_detection_label.setText(
                 "✓ This PDF contains extractable text. Text extraction will be fast."
             )
-            self.text_detection_label.setStyleSheet("color: #27ae60; font-style: italic;")
+            self.text_detection_label.setStyleSheet(self.TEXT_FOUND_STYLE)
         else:
             self.text_detection_label.setText(
                 "⚠ This PDF appears to be scanned/image-based. OCR will be used."
             )
-            self.text_detection_label.setStyleSheet("color: #f39c12; font-style: italic;")
-        
-        self.text_detection_label.setVisible(True)
+            self.text_detection_label.setStyleSheet(self.TEXT_MISSING_STYLE)
         
         # Enable convert button
         self.convert_button.setEnabled(True)
-        
-        # Hide previous status
-        self.status_label.setVisible(False)
     
     def _get_settings(self) -> PDFToWordSettings:
         """Get current settings from UI."""
@@ -454,12 +441,10 @@ class PDFToWordPage(QWidget):
         conversion_mode = self.mode_combo.currentData()
         
         # Get language
-        lang_display = self.language_combo.currentText()
-        lang_code = self.LANGUAGES.get(lang_display, "eng")
+        lang_code = self.language_combo.currentData()
         
         # Get DPI
-        quality_text = self.quality_combo.currentText()
-        dpi = self.QUALITY_PRESETS.get(quality_text, 300)
+        dpi = self.quality_combo.currentData()
         
         # Get accuracy mode
         if self.fast_radio.isChecked():
@@ -469,6 +454,12 @@ class PDFToWordPage(QWidget):
         else:
             accuracy_mode = AccuracyMode.BALANCED
         
+        # Cap the resolution for text extraction and OCR; only the layout mode embeds page images
+        if conversion_mode != ConversionMode.PRESERVE_LAYOUT:
+            dpi = min(dpi, self.MAX_TEXT_DPI)
+            if accuracy_mode == AccuracyMode.FAST:
+                dpi = min(dpi, self.FAST_MAX_DPI)
+        
         return PDFToWordSettings(
             conversion_mode=conversion_mode,
             language=lang_code,
@@ -483,6 +474,9 @@ class PDFToWordPage(QWidget):
         if not self.selected_pdf:
             return
         
+        if self.worker is not None and self.worker.isRunning():
+            return
+        
         settings = self._get_settings()
         
         # Check if OCR is needed but not available
@@ -533,12 +527,11 @@ class PDFToWordPage(QWidget):
     
     def _on_progress(self, current: int, total: int, message: str):
         """Handle progress updates."""
-        if total > 0:
-            percent = int((current / total) * 100)
-            self.progress_bar.setValue(percent)
-            self.progress_bar.setFormat(f"{message} ({percent}%)")
-        else:
-            self.progress_bar.setFormat(message)
+        # The bar counts pages directly and Qt computes the percentage; a zero total
+        # gives a 0-0 range, which Qt shows as a busy indicator instead of a stale value
+        self.progress_bar.setMaximum(total)
+        self.progress_bar.setValue(current)
+        self.progress_bar.setFormat(f"{message} (%p%)" if total > 0 else message)
     
     def _on_conversion_finished(self, result: ConversionResult):
         """Handle conversion completion."""
@@ -551,7 +544,7 @@ class PDFToWordPage(QWidget):
                 f"✓ Successfully converted {result.pages_converted} pages{ocr_info}!\n"
                 f"Saved to: {result.output_path}"
             )
-            self.status_label.setStyleSheet("color: #27ae60; font-weight: bold;")
+            self.status_label.setStyleSheet(STATUS_OK_STYLE)
             
             # Ask if user wants to open the file
             reply = QMessageBox.question(
@@ -563,13 +556,11 @@ class PDFToWordPage(QWidget):
             )
             
             if reply == QMessageBox.StandardButton.Yes:
-                import subprocess
-                import os
                 # Open the file directly with default application
-                os.startfile(result.output_path)
+                QDesktopServices.openUrl(QUrl.fromLocalFile(result.output_path))
         else:
             self.status_label.setText(f"✗ Conversion failed: {result.error_message}")
-            self.status_label.setStyleSheet("color: #e74c3c; font-weight: bold;")
+            self.status_label.setStyleSheet(STATUS_ERROR_STYLE)
             
             QMessageBox.critical(
                 self,
@@ -578,4 +569,9 @@ class PDFToWordPage(QWidget):
             )
         
         self.status_label.setVisible(True)
+        
+        # The result is emitted just before run() returns; wait for the thread to
+        # finish, then let Qt free it (deletion also drops its signal connections)
+        self.worker.wait()
+        self.worker.deleteLater()
         self.worker = None
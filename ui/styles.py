@@ -0,0 +1,29 @@
+"""
+Shared stylesheets.
+Kept as module constants so pages reuse one string instead of building the
+same QSS literal each time a widget is set up.
+"""
+
+TITLE_STYLE = "font-size: 24px; font-weight: bold; color: #ffffff;"
+DESCRIPTION_STYLE = "font-size: 13px; color: #7f8c8d;"
+PAGE_INFO_STYLE = "color: #ffffff; font-weight: bold;"
+STATUS_OK_STYLE = "color: #27ae60; font-weight: bold;"
+STATUS_ERROR_STYLE = "color: #e74c3c; font-weight: bold;"
+
+PRIMARY_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #3498db;
+        color: white;
+        font-size: 14px;
+        font-weight: bold;
+        border: none;
+        border-radius: 5px;
+    }
+    QPushButton:hover {
+        background-color: #2980b9;
+    }
+    QPushButton:disabled {
+        background-color: #5d6d7e;
+        color: #aeb6bf;
+    }
+"""
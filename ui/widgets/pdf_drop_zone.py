@@ -0,0 +1,93 @@
+"""
+PDF drop zone widget.
+Dashed frame that accepts a dropped PDF file or opens a file browser when clicked.
+"""
+import os
+from pathlib import Path
+from PySide6.QtWidgets import QFrame, QVBoxLayout, QLabel
+from PySide6.QtCore import Qt, Signal
+
+
+class PdfDropZone(QFrame):
+    """Drop target for a single PDF file."""
+    fileDropped = Signal(str)  # path of the first dropped PDF
+    clicked = Signal()
+    
+    STYLE_SHEET = """
+        QFrame {
+            border: 2px dashed #bdc3c7;
+            border-radius: 10px;
+            background-color: #ecf0f1;
+        }
+        QFrame:hover {
+            border-color: #3498db;
+            background-color: #e8f4f8;
+        }
+    """
+    PLACEHOLDER_LABEL_STYLE = "color: #2c3e50; font-style: italic; font-weight: bold; border: none; background: transparent;"
+    SELECTED_LABEL_STYLE = "color: #2c3e50; font-style: normal; font-weight: bold; border: none; background: transparent;"
+    
+    def __init__(self, text: str = "Drag and drop a PDF file here\nor click Browse...", parent=None):
+        super().__init__(parent)
+        self.setAcceptDrops(True)
+        self.setMinimumHeight(100)
+        self.setStyleSheet(self.STYLE_SHEET)
+        self.setCursor(Qt.CursorShape.PointingHandCursor)
+        
+        layout = QVBoxLayout(self)
+        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        
+        self.label = QLabel(text)
+        self.label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.label.setStyleSheet(self.PLACEHOLDER_LABEL_STYLE)
+        layout.addWidget(self.label)
+    
+    def set_file(self, file_path: str):
+        """
+        Show a loaded file's name.
+        
+        Text and stylesheet are only set when they change, so loading the same
+        file again does not make Qt re-parse the label's stylesheet.
+        """
+        text = f"📄 {Path(file_path).name}"
+        if self.label.text() != text:
+            self.label.setText(text)
+        if self.label.styleSheet() != self.SELECTED_LABEL_STYLE:
+            self.label.setStyleSheet(self.SELECTED_LABEL_STYLE)
+            # Change cursor to default since a file is now loaded
+            self.setCursor(Qt.CursorShape.ArrowCursor)
+    
+    @staticmethod
+    def _dragged_pdf(event):
+        """Return the first PDF path among the dragged URLs, or None."""
+        if event.mimeData().hasUrls():
+            for url in event.mimeData().urls():
+                file_path = url.toLocalFile()
+                # Compare only the extension instead of lowercasing the whole path
+                if os.path.splitext(file_path)[1].lower() == '.pdf':
+                    return file_path
+        return None
+    
+    def dragEnterEvent(self, event):
+        """Accept the drag if it carries a PDF."""
+        if self._dragged_pdf(event) is not None:
+            event.acceptProposedAction()
+        else:
+            event.ignore()
+    
+    def dragMoveEvent(self, event):
+        """Accept the drag if it carries a PDF."""
+        self.dragEnterEvent(event)
+    
+    def dropEvent(self, event):
+        """Emit fileDropped for the first dropped PDF."""
+        file_path = self._dragged_pdf(event)
+        if file_path is not None:
+            event.acceptProposedAction()
+            self.fileDropped.emit(file_path)
+        else:
+            event.ignore()
+    
+    def mousePressEvent(self, event):
+        """Emit clicked so the page can open its file browser."""
+        self.clicked.emit()
@@ -0,0 +1,113 @@
+"""
+On-disk thumbnail cache.
+Stores rendered page thumbnails under the user's cache directory so that
+reopening an unchanged PDF does not have to rasterize its pages again.
+"""
+import hashlib
+import os
+from pathlib import Path
+from typing import Optional
+
+from PySide6.QtCore import QStandardPaths
+from PySide6.QtGui import QImage
+
+
+class ThumbnailDiskCache:
+    """Disk cache of page thumbnails keyed by source file identity."""
+    
+    def __init__(
+        self,
+        name: str,
+        max_bytes: int = 500 * 1024 * 1024,
+        image_format: str = "webp",
+        quality: int = 80
+    ):
+        """
+        Args:
+            name: Subdirectory of the application cache location to use
+            max_bytes: Total size the cache is trimmed back to by evict()
+            image_format: Qt image format used for stored thumbnails
+            quality: Encoder quality passed to QImage.save
+        """
+        cache_root = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+        self.root = Path(cache_root) / name
+        self.max_bytes = max_bytes
+        self.image_format = image_format
+        self.quality = quality
+    
+    @staticmethod
+    def file_key(file_path: str, *variant) -> str:
+        """
+        Build a cache key from a file's resolved path, modification time and size.
+        
+        Any edit to the file changes its mtime or size and therefore its key.
+        Extra variant values (e.g. a thumbnail size) are mixed into the key so
+        different renderings of the same file do not collide.
+        """
+        stat = os.stat(file_path)
+        identity = "|".join(str(part) for part in (Path(file_path).resolve(), stat.st_mtime_ns, stat.st_size, *variant))
+        return hashlib.blake2b(identity.encode("utf-8"), digest_size=16).hexdigest()
+    
+    def _path_for(self, key: str, page_num: int) -> Path:
+        return self.root / key / f"{page_num}.{self.image_format}"
+    
+    def load(self, key: str, page_num: int) -> Optional[QImage]:
+        """Return the cached thumbnail for a page, or None on a miss."""
+        path = self._path_for(key, page_num)
+        if not path.exists():
+            return None
+        
+        image = QImage(str(path))
+        if image.isNull():
+            return None
+        
+        # Refresh the mtime so eviction treats this entry as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return image
+    
+    def save(self, key: str, page_num: int, image: QImage) -> bool:
+        """Store a page thumbnail. Failures are ignored; the cache is best effort."""
+        path = self._path_for(key, page_num)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            return False
+        return image.save(str(path), self.image_format.upper(), self.quality)
+    
+    def evict(self):
+        """Delete the least recently used thumbnails until the cache fits in max_bytes."""
+        if not self.root.exists():
+            return
+        
+        entries = []
+        total_bytes = 0
+        for path in self.root.glob(f"*/*.{self.image_format}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total_bytes += stat.st_size
+        
+        if total_bytes <= self.max_bytes:
+            return
+        
+        entries.sort()
+        for _, size, path in entries:
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+                total_bytes -= size
+            except OSError:
+                continue
+        
+        # Remove directories left empty by eviction
+        for directory in self.root.iterdir():
+            try:
+                directory.rmdir()
+            except OSError:
+                pass